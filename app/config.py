@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     secret_key: str = "dev-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 1 week
+    bcrypt_rounds: int = 12  # log2 work factor for password hashes
 
     # Email / SMTP settings (leave smtp_host empty to disable email sending)
     smtp_host: str = ""
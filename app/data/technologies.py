@@ -17,7 +17,9 @@ Within each category:
 from __future__ import annotations
 
 import enum
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 
 class TechCategory(str, enum.Enum):
@@ -29,25 +31,29 @@ class TechCategory(str, enum.Enum):
     ancient = "ancient"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TechEffect:
     """Structured description of a technology's game effect."""
     # Effect type: "income_bonus", "stat_bonus", "unlock", "vp", "special"
     effect_type: str
-    # Free-form parameters, interpreted by the game engine
-    params: dict = field(default_factory=dict)
+    # Free-form parameters, interpreted by the game engine. Stored read-only
+    # and left out of the hash, since a mapping is not hashable.
+    params: Mapping = field(default_factory=dict, hash=False)
     # Human-readable description for UI/API display
     description: str = ""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "params", MappingProxyType(dict(self.params)))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Technology:
     tech_id: str
     name: str
     category: TechCategory
     base_cost: int                    # Science cost before category discounts
-    prerequisites: list[str]          # tech_ids that must be owned first
-    effects: list[TechEffect]         # Structured game effects
+    prerequisites: tuple[str, ...]    # tech_ids that must be owned first
+    effects: tuple[TechEffect, ...]   # Structured game effects
     flavor_text: str = ""
     # False for ancient/discovery techs that cannot be researched normally
     can_research: bool = True
@@ -61,14 +67,14 @@ _MILITARY_TECHS: list[Technology] = [
         name="Improved Hull",
         category=TechCategory.military,
         base_cost=2,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "hull", "amount": 1, "targets": "all"},
                 description="+1 hull on all ship blueprints",
-            )
-        ],
+            ),
+        ),
         flavor_text="Reinforced plating extends ship survivability.",
     ),
     Technology(
@@ -76,14 +82,14 @@ _MILITARY_TECHS: list[Technology] = [
         name="Sentient Hull",
         category=TechCategory.military,
         base_cost=3,
-        prerequisites=["improved_hull"],
-        effects=[
+        prerequisites=("improved_hull",),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "self_repair", "amount": 1},
                 description="Ships repair 1 hull damage at the start of each combat round",
-            )
-        ],
+            ),
+        ),
         flavor_text="The hull itself responds to damage.",
     ),
     Technology(
@@ -91,14 +97,14 @@ _MILITARY_TECHS: list[Technology] = [
         name="Gauss Shield",
         category=TechCategory.military,
         base_cost=4,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "shield", "amount": 2, "targets": "all"},
                 description="+2 shield on all ship blueprints",
-            )
-        ],
+            ),
+        ),
         flavor_text="Electromagnetic field deflects incoming fire.",
     ),
     Technology(
@@ -106,8 +112,8 @@ _MILITARY_TECHS: list[Technology] = [
         name="Phase Shield",
         category=TechCategory.military,
         base_cost=6,
-        prerequisites=["gauss_shield"],
-        effects=[
+        prerequisites=("gauss_shield",),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "shield", "amount": 3, "targets": "all"},
@@ -118,7 +124,7 @@ _MILITARY_TECHS: list[Technology] = [
                 params={"special": "dodge_once_per_round"},
                 description="Negate one hit per combat round",
             ),
-        ],
+        ),
         flavor_text="Phase shifting renders ships briefly intangible.",
     ),
     Technology(
@@ -126,14 +132,14 @@ _MILITARY_TECHS: list[Technology] = [
         name="Neural Targeting",
         category=TechCategory.military,
         base_cost=5,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "computer", "amount": 1, "targets": "all"},
                 description="+1 computer on all ship blueprints",
-            )
-        ],
+            ),
+        ),
         flavor_text="Neural-linked targeting systems increase accuracy.",
     ),
     Technology(
@@ -141,14 +147,14 @@ _MILITARY_TECHS: list[Technology] = [
         name="Advanced Targeting",
         category=TechCategory.military,
         base_cost=7,
-        prerequisites=["neural_targeting"],
-        effects=[
+        prerequisites=("neural_targeting",),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "computer", "amount": 2, "targets": "all"},
                 description="+2 computer on all ship blueprints",
-            )
-        ],
+            ),
+        ),
         flavor_text="Predictive algorithms anticipate enemy evasion.",
     ),
 ]
@@ -161,14 +167,14 @@ _GRID_TECHS: list[Technology] = [
         name="Nuclear Drive",
         category=TechCategory.grid,
         base_cost=2,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "nuclear_drive"},
                 description="Unlocks Nuclear Drive component (movement +1)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Controlled fission propulsion.",
     ),
     Technology(
@@ -176,14 +182,14 @@ _GRID_TECHS: list[Technology] = [
         name="Fusion Drive",
         category=TechCategory.grid,
         base_cost=4,
-        prerequisites=["nuclear_drive"],
-        effects=[
+        prerequisites=("nuclear_drive",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "fusion_drive"},
                 description="Unlocks Fusion Drive component (movement +2)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Fusion reactions yield far greater thrust.",
     ),
     Technology(
@@ -191,14 +197,14 @@ _GRID_TECHS: list[Technology] = [
         name="Warp Drive",
         category=TechCategory.grid,
         base_cost=6,
-        prerequisites=["fusion_drive"],
-        effects=[
+        prerequisites=("fusion_drive",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "warp_drive"},
                 description="Unlocks Warp Drive component (movement +3)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Spacetime folding allows near-instantaneous travel.",
     ),
     Technology(
@@ -206,14 +212,14 @@ _GRID_TECHS: list[Technology] = [
         name="Nuclear Source",
         category=TechCategory.grid,
         base_cost=3,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "nuclear_source"},
                 description="Unlocks Nuclear Source component (+3 power)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Compact fission reactor.",
     ),
     Technology(
@@ -221,14 +227,14 @@ _GRID_TECHS: list[Technology] = [
         name="Fusion Source",
         category=TechCategory.grid,
         base_cost=5,
-        prerequisites=["nuclear_source"],
-        effects=[
+        prerequisites=("nuclear_source",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "fusion_source"},
                 description="Unlocks Fusion Source component (+6 power)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Sustained fusion reaction for abundant energy.",
     ),
     Technology(
@@ -236,14 +242,14 @@ _GRID_TECHS: list[Technology] = [
         name="Antimatter Source",
         category=TechCategory.grid,
         base_cost=8,
-        prerequisites=["fusion_source"],
-        effects=[
+        prerequisites=("fusion_source",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "antimatter_source"},
                 description="Unlocks Antimatter Source component (+9 power)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Matter-antimatter annihilation provides near-unlimited power.",
     ),
 ]
@@ -256,14 +262,14 @@ _NANO_TECHS: list[Technology] = [
         name="Advanced Mining",
         category=TechCategory.nano,
         base_cost=3,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="income_bonus",
                 params={"resource": "materials", "per": "advanced_planet", "amount": 1},
                 description="+1 material per advanced (brown) planet square during upkeep",
-            )
-        ],
+            ),
+        ),
         flavor_text="Robotic miners extract resources from asteroids.",
     ),
     Technology(
@@ -271,14 +277,14 @@ _NANO_TECHS: list[Technology] = [
         name="Nanorobots",
         category=TechCategory.nano,
         base_cost=5,
-        prerequisites=["advanced_mining"],
-        effects=[
+        prerequisites=("advanced_mining",),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "build_anywhere"},
                 description="Can build ships in any controlled hex, not just homeworld",
-            )
-        ],
+            ),
+        ),
         flavor_text="Self-replicating nanomachines enable distributed construction.",
     ),
     Technology(
@@ -286,14 +292,14 @@ _NANO_TECHS: list[Technology] = [
         name="Quantum Grid",
         category=TechCategory.nano,
         base_cost=4,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="income_bonus",
                 params={"resource": "science", "per": "science_planet", "amount": 1},
                 description="+1 science per science (pink) planet square during upkeep",
-            )
-        ],
+            ),
+        ),
         flavor_text="Quantum computing multiplies research output.",
     ),
     Technology(
@@ -301,14 +307,14 @@ _NANO_TECHS: list[Technology] = [
         name="Conifold Field",
         category=TechCategory.nano,
         base_cost=6,
-        prerequisites=["quantum_grid"],
-        effects=[
+        prerequisites=("quantum_grid",),
+        effects=(
             TechEffect(
                 effect_type="income_bonus",
                 params={"resource": "science", "flat": 2},
                 description="+2 science per round (flat bonus during upkeep)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Resonant fields amplify scientific output across the empire.",
     ),
     Technology(
@@ -316,14 +322,14 @@ _NANO_TECHS: list[Technology] = [
         name="Orbital",
         category=TechCategory.nano,
         base_cost=5,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "orbital_population"},
                 description="Unlocks orbital population cube type for colonization",
-            )
-        ],
+            ),
+        ),
         flavor_text="Space habitats allow colonization of any orbit.",
     ),
     Technology(
@@ -331,14 +337,14 @@ _NANO_TECHS: list[Technology] = [
         name="Morphogenesis",
         category=TechCategory.nano,
         base_cost=7,
-        prerequisites=["orbital"],
-        effects=[
+        prerequisites=("orbital",),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "any_cube_any_planet"},
                 description="Population cubes of any type may be placed on any planet type",
-            )
-        ],
+            ),
+        ),
         flavor_text="Adaptive biology allows colonization of any environment.",
     ),
 ]
@@ -351,14 +357,14 @@ _QUANTUM_TECHS: list[Technology] = [
         name="Ion Cannon",
         category=TechCategory.quantum,
         base_cost=2,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "ion_cannon"},
                 description="Unlocks Ion Cannon component (2 damage)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Focused ion beams disrupt enemy hull integrity.",
     ),
     Technology(
@@ -366,14 +372,14 @@ _QUANTUM_TECHS: list[Technology] = [
         name="Plasma Cannon",
         category=TechCategory.quantum,
         base_cost=6,
-        prerequisites=["ion_cannon"],
-        effects=[
+        prerequisites=("ion_cannon",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "plasma_cannon"},
                 description="Unlocks Plasma Cannon component (4 damage)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Superheated plasma tears through any shield.",
     ),
     Technology(
@@ -381,14 +387,14 @@ _QUANTUM_TECHS: list[Technology] = [
         name="Antimatter Cannon",
         category=TechCategory.quantum,
         base_cost=9,
-        prerequisites=["plasma_cannon"],
-        effects=[
+        prerequisites=("plasma_cannon",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "antimatter_cannon"},
                 description="Unlocks Antimatter Cannon component (7 damage)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Antimatter annihilation delivers catastrophic damage.",
     ),
     Technology(
@@ -396,14 +402,14 @@ _QUANTUM_TECHS: list[Technology] = [
         name="Flux Missile",
         category=TechCategory.quantum,
         base_cost=3,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "flux_missile"},
                 description="Unlocks Flux Missile component (2 damage, fires before cannons)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Guided warheads strike before combat is joined.",
     ),
     Technology(
@@ -411,14 +417,14 @@ _QUANTUM_TECHS: list[Technology] = [
         name="Plasma Missile",
         category=TechCategory.quantum,
         base_cost=6,
-        prerequisites=["flux_missile"],
-        effects=[
+        prerequisites=("flux_missile",),
+        effects=(
             TechEffect(
                 effect_type="unlock",
                 params={"component": "plasma_missile"},
                 description="Unlocks Plasma Missile component (4 damage, fires before cannons)",
-            )
-        ],
+            ),
+        ),
         flavor_text="Plasma-tipped warheads for devastating opening salvos.",
     ),
     Technology(
@@ -426,8 +432,8 @@ _QUANTUM_TECHS: list[Technology] = [
         name="Positron Computer",
         category=TechCategory.quantum,
         base_cost=3,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "computer", "amount": 2, "targets": "all"},
@@ -438,7 +444,7 @@ _QUANTUM_TECHS: list[Technology] = [
                 params={"component": "positron_computer"},
                 description="Unlocks Positron Computer component for blueprints",
             ),
-        ],
+        ),
         flavor_text="Antimatter-based processors with unparalleled targeting.",
     ),
 ]
@@ -451,14 +457,14 @@ _RARE_TECHS: list[Technology] = [
         name="Cloaking Device",
         category=TechCategory.rare,
         base_cost=5,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "cloak_first_round"},
                 description="Your ships cannot be targeted in the first combat round",
-            )
-        ],
+            ),
+        ),
         flavor_text="Rare metamaterials bend light around the hull.",
     ),
     Technology(
@@ -466,14 +472,14 @@ _RARE_TECHS: list[Technology] = [
         name="Tachyon Drive",
         category=TechCategory.rare,
         base_cost=6,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "pass_through_systems"},
                 description="Ships may pass through enemy systems without initiating combat",
-            )
-        ],
+            ),
+        ),
         flavor_text="Faster-than-light travel bypasses spatial obstacles.",
     ),
     Technology(
@@ -481,14 +487,14 @@ _RARE_TECHS: list[Technology] = [
         name="Point Defense",
         category=TechCategory.rare,
         base_cost=4,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "negate_one_missile_hit_per_round"},
                 description="Negate one incoming missile hit per combat round",
-            )
-        ],
+            ),
+        ),
         flavor_text="Close-in weapons systems intercept incoming warheads.",
     ),
     Technology(
@@ -496,14 +502,14 @@ _RARE_TECHS: list[Technology] = [
         name="Distortion Shield",
         category=TechCategory.rare,
         base_cost=7,
-        prerequisites=["point_defense"],
-        effects=[
+        prerequisites=("point_defense",),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "shield", "amount": 4, "targets": "all", "vs": "missile"},
                 description="+4 shield specifically vs missiles on all blueprints",
-            )
-        ],
+            ),
+        ),
         flavor_text="Reality distortion field scatters missile targeting.",
     ),
     Technology(
@@ -511,14 +517,14 @@ _RARE_TECHS: list[Technology] = [
         name="Absorption Shield",
         category=TechCategory.rare,
         base_cost=7,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "absorb_one_damage_per_round"},
                 description="Absorb 1 hull damage per combat round",
-            )
-        ],
+            ),
+        ),
         flavor_text="Energy-absorbing matrix converts kinetic energy to power.",
     ),
     Technology(
@@ -526,14 +532,14 @@ _RARE_TECHS: list[Technology] = [
         name="Carapace Hull",
         category=TechCategory.rare,
         base_cost=4,
-        prerequisites=[],
-        effects=[
+        prerequisites=(),
+        effects=(
             TechEffect(
                 effect_type="stat_bonus",
                 params={"attribute": "hull", "amount": 2, "targets": "dreadnought"},
                 description="+2 hull on Dreadnought blueprints",
-            )
-        ],
+            ),
+        ),
         flavor_text="Rare crystalline armor provides extreme protection for capital ships.",
     ),
 ]
@@ -547,15 +553,15 @@ _ANCIENT_TECHS: list[Technology] = [
         name="Artifact Key",
         category=TechCategory.ancient,
         base_cost=0,
-        prerequisites=[],
+        prerequisites=(),
         can_research=False,
-        effects=[
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "use_ancient_artifacts"},
                 description="Allows activation of ancient artifact devices",
-            )
-        ],
+            ),
+        ),
         flavor_text="A key to the vaults of a lost civilization.",
     ),
     Technology(
@@ -563,15 +569,15 @@ _ANCIENT_TECHS: list[Technology] = [
         name="Transporter",
         category=TechCategory.ancient,
         base_cost=0,
-        prerequisites=[],
+        prerequisites=(),
         can_research=False,
-        effects=[
+        effects=(
             TechEffect(
                 effect_type="special",
                 params={"special": "relocate_population"},
                 description="Move population cubes between any two of your colonies",
-            )
-        ],
+            ),
+        ),
         flavor_text="Instantaneous matter transmission derived from ancient science.",
     ),
     Technology(
@@ -579,15 +585,15 @@ _ANCIENT_TECHS: list[Technology] = [
         name="Monolith",
         category=TechCategory.ancient,
         base_cost=0,
-        prerequisites=[],
+        prerequisites=(),
         can_research=False,
-        effects=[
+        effects=(
             TechEffect(
                 effect_type="vp",
                 params={"vp": 2, "trigger": "game_end"},
                 description="+2 VP at the end of the game",
-            )
-        ],
+            ),
+        ),
         flavor_text="A mysterious structure of immense cultural significance.",
     ),
     Technology(
@@ -595,15 +601,15 @@ _ANCIENT_TECHS: list[Technology] = [
         name="Prospector",
         category=TechCategory.ancient,
         base_cost=0,
-        prerequisites=[],
+        prerequisites=(),
         can_research=False,
-        effects=[
+        effects=(
             TechEffect(
                 effect_type="income_bonus",
                 params={"resource": "money", "flat": 3, "once": True},
                 description="Immediately gain 3 money when discovered",
-            )
-        ],
+            ),
+        ),
         flavor_text="Ancient survey equipment reveals hidden resource deposits.",
     ),
 ]
@@ -622,6 +628,15 @@ _ALL_TECHS: dict[str, Technology] = {
     )
 }
 
+# The definitions are static, so the list views are built once at import and
+# shared by every caller (tuples, so callers cannot change them).
+_TECH_LIST: tuple[Technology, ...] = tuple(_ALL_TECHS.values())
+_RESEARCHABLE_TECHS: tuple[Technology, ...] = tuple(t for t in _TECH_LIST if t.can_research)
+_TECHS_BY_CATEGORY: dict[TechCategory, tuple[Technology, ...]] = {
+    category: tuple(t for t in _TECH_LIST if t.category == category)
+    for category in TechCategory
+}
+
 
 def get_technology(tech_id: str) -> Technology:
     """Return a Technology definition or raise KeyError."""
@@ -631,16 +646,16 @@ def get_technology(tech_id: str) -> Technology:
     return tech
 
 
-def list_technologies() -> list[Technology]:
+def list_technologies() -> tuple[Technology, ...]:
     """Return all technology definitions."""
-    return list(_ALL_TECHS.values())
+    return _TECH_LIST
 
 
-def list_researchable_technologies() -> list[Technology]:
+def list_researchable_technologies() -> tuple[Technology, ...]:
     """Return only technologies that can be acquired through normal research."""
-    return [t for t in _ALL_TECHS.values() if t.can_research]
+    return _RESEARCHABLE_TECHS
 
 
-def list_technologies_by_category(category: TechCategory) -> list[Technology]:
+def list_technologies_by_category(category: TechCategory) -> tuple[Technology, ...]:
     """Return all technologies in a given category."""
-    return [t for t in _ALL_TECHS.values() if t.category == category]
+    return _TECHS_BY_CATEGORY[category]
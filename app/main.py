@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,11 +10,21 @@ from app.routers import research
 from app.routers import ships
 from app.routers import combat
 from app.routers import council
+from app.services.notification_service import drain_pending_sends
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Let notification emails that are already on their way finish sending.
+    await drain_pending_sends()
+
 
 app = FastAPI(
     title="Eclipse: Second Dawn for the Galaxy",
     description="Browser-based digital implementation of Eclipse Second Dawn",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
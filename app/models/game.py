@@ -22,6 +22,7 @@ class GamePhase(str, enum.Enum):
 
 class Game(Base):
     __tablename__ = "games"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -45,6 +45,7 @@ from app.services.game_service import (
 )
 from app.services.map_generator import get_map_tiles, get_system_for_tile
 from app.services.ship_service import get_ships_for_tile
+from app.services.turn_engine import get_active_player
 
 router = APIRouter(prefix="/games", tags=["games"])
 
@@ -100,6 +101,7 @@ async def _game_response_for_user(db: AsyncSession, game, players, current_user_
             )
             for p in players
         ],
+        active_player_id=next((p.id for p in players if p.is_active_turn), None),
         deletion_status=await _build_deletion_status(db, game.id, current_user_id),
     )
 
@@ -305,8 +307,7 @@ async def get_game_status(
 ):
     """Return a lightweight game status summary for polling."""
     game = await _get_game_or_404(db, game_id)
-    players = await get_players_for_game(db, game.id)
-    active_player = next((p for p in players if p.is_active_turn), None)
+    active_player = await get_active_player(db, game.id)
     return GameStatusResponse(
         id=game.id,
         name=game.name,
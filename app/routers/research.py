@@ -14,10 +14,11 @@ from app.schemas.research import (
 from app.services.game_service import get_game, get_player_in_game, get_players_for_game
 from app.services.research_service import (
     calculate_effective_cost,
-    count_techs_in_category,
+    count_techs_by_category,
+    get_player_tech_ids,
     get_player_technologies,
 )
-from app.data.technologies import get_technology, list_technologies
+from app.data.technologies import get_technology, list_researchable_technologies
 
 router = APIRouter(prefix="/games", tags=["research"])
 
@@ -73,7 +74,7 @@ async def get_player_technologies_endpoint(
                 acquired_round=rec.acquired_round,
                 acquired_at=rec.acquired_at,
                 effects=[
-                    {"effect_type": e.effect_type, "params": e.params, "description": e.description}
+                    {"effect_type": e.effect_type, "params": dict(e.params), "description": e.description}
                     for e in tech.effects
                 ],
             )
@@ -114,21 +115,17 @@ async def get_available_technologies_endpoint(
             detail="Player not found in this game",
         )
 
-    from app.services.research_service import get_player_tech_ids
     owned_ids = await get_player_tech_ids(player_id, db)
+    # Count per category once rather than querying for every candidate tech.
+    owned_per_category = count_techs_by_category(owned_ids)
 
     result = []
-    for tech in list_technologies():
-        if not tech.can_research:
-            continue
+    for tech in list_researchable_technologies():
         if tech.tech_id in owned_ids:
             continue
-        # Check prerequisites
-        prereqs_met = all(p in owned_ids for p in tech.prerequisites)
-        if not prereqs_met:
+        if not owned_ids.issuperset(tech.prerequisites):
             continue
-        owned_count = await count_techs_in_category(player_id, tech.category, db)
-        effective_cost = calculate_effective_cost(tech, owned_count)
+        effective_cost = calculate_effective_cost(tech, owned_per_category[tech.category])
         result.append(
             TechnologyDefinitionResponse(
                 tech_id=tech.tech_id,
@@ -139,7 +136,7 @@ async def get_available_technologies_endpoint(
                 prerequisites=tech.prerequisites,
                 can_research=tech.can_research,
                 effects=[
-                    {"effect_type": e.effect_type, "params": e.params, "description": e.description}
+                    {"effect_type": e.effect_type, "params": dict(e.params), "description": e.description}
                     for e in tech.effects
                 ],
                 flavor_text=tech.flavor_text,
@@ -42,6 +42,7 @@ class GameResponse(BaseModel):
     host_user_id: Optional[int]
     created_at: datetime
     players: list[PlayerResponse] = []
+    active_player_id: Optional[int] = None
     deletion_status: "GameDeletionStatusResponse | None" = None
 
     model_config = {"from_attributes": True}
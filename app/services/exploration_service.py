@@ -32,26 +32,32 @@ from app.services.resource_service import get_player_resources, use_influence_di
 # Discovery deck initialization
 # ---------------------------------------------------------------------------
 
-async def initialize_discovery_deck(db: AsyncSession, game_id: int) -> list[DiscoveryTile]:
+async def initialize_discovery_deck(
+    db: AsyncSession, game_id: int, *, order: list[str] | None = None
+) -> list[DiscoveryTile]:
     """Create a shuffled discovery deck for a game.
 
     One DiscoveryTile row per template, with a random draw_order assigned.
+    Pass `order` (discovery ids, first draw first) to lay out the deck
+    deterministically instead of shuffling.
     Called from game_service.start_game.
     """
-    templates = list(DISCOVERY_TILE_TEMPLATES)
-    random.shuffle(templates)
-
-    tiles: list[DiscoveryTile] = []
-    for order, template in enumerate(templates):
-        tile = DiscoveryTile(
+    if order is None:
+        discovery_ids = [t.discovery_id for t in DISCOVERY_TILE_TEMPLATES]
+        random.shuffle(discovery_ids)
+    else:
+        discovery_ids = order
+
+    tiles = [
+        DiscoveryTile(
             game_id=game_id,
-            discovery_template_id=template.discovery_id,
-            draw_order=order,
+            discovery_template_id=discovery_id,
+            draw_order=draw_order,
             is_drawn=False,
         )
-        db.add(tile)
-        tiles.append(tile)
-
+        for draw_order, discovery_id in enumerate(discovery_ids)
+    ]
+    db.add_all(tiles)
     await db.flush()
     return tiles
 
@@ -434,20 +440,13 @@ async def get_full_map(db: AsyncSession, game_id: int) -> list[dict]:
     - system info if explored (name, planets, wormholes, ancient_ships_count)
     - ships present on the tile
     """
-    # Fetch all tiles
+    # Fetch all tiles together with their system (None while unexplored)
     tile_result = await db.execute(
-        select(HexTile).where(HexTile.game_id == game_id)
+        select(HexTile, System)
+        .outerjoin(System, System.hex_tile_id == HexTile.id)
+        .where(HexTile.game_id == game_id)
     )
-    tiles = list(tile_result.scalars().all())
-
-    # Fetch all systems for this game (join via hex_tile)
-    tile_ids = [t.id for t in tiles]
-    system_result = await db.execute(
-        select(System).where(System.hex_tile_id.in_(tile_ids))
-    )
-    systems_by_tile: dict[int, System] = {
-        s.hex_tile_id: s for s in system_result.scalars().all()
-    }
+    tiles_with_systems = tile_result.all()
 
     # Fetch all ships for this game
     ship_result = await db.execute(
@@ -459,7 +458,7 @@ async def get_full_map(db: AsyncSession, game_id: int) -> list[dict]:
             ships_by_tile.setdefault(ship.hex_tile_id, []).append(ship)
 
     map_data: list[dict] = []
-    for tile in tiles:
+    for tile, sys in tiles_with_systems:
         entry: dict = {
             "id": tile.id,
             "q": tile.q,
@@ -470,7 +469,6 @@ async def get_full_map(db: AsyncSession, game_id: int) -> list[dict]:
             "system": None,
             "ships": [],
         }
-        sys = systems_by_tile.get(tile.id)
         if sys is not None:
             entry["system"] = {
                 "id": sys.id,
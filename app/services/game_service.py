@@ -166,13 +166,13 @@ async def start_game(db: AsyncSession, game: Game, user: User) -> Game:
     # Initialize the discovery tile deck (shuffled)
     await initialize_discovery_deck(db, game.id)
 
-    await db.commit()
-    await db.refresh(game)
-
-    # Notify all players that the game has started (best-effort)
+    # Notify all players that the game has started (sent once the commit succeeds)
     from app.services.notification_service import notify_game_started
     await notify_game_started(db, game, players)
 
+    await db.commit()
+    await db.refresh(game)
+
     return game
 
 
@@ -134,10 +134,6 @@ async def generate_map(db: AsyncSession, game_id: int, players: list[Player]) ->
     )
     db.add(gc_tile)
     placed[(0, 0)] = gc_tile
-    await db.flush()
-
-    gc_system = _make_system(gc_tile, GALACTIC_CENTER, 0)
-    db.add(gc_system)
 
     # ---- Homeworld and starting sector tiles (one per player) ----
     sorted_players = sorted(players, key=lambda p: p.turn_order if p.turn_order is not None else 0)
@@ -186,13 +182,6 @@ async def generate_map(db: AsyncSession, game_id: int, players: list[Player]) ->
         placed[(ss_q, ss_r)] = ss_tile
         player_tiles.append(ss_tile)
 
-    await db.flush()
-
-    # Create System records for all pre-explored player tiles
-    for tile in player_tiles:
-        template = ALL_TILES[tile.tile_template_id]
-        db.add(_make_system(tile, template, tile.rotation))
-
     # ---- Ring 1: inner tiles (all 6 positions, never overlap with player sectors) ----
     ring1_positions = hex_ring(0, 0, 1)
     inner_available = [pos for pos in ring1_positions if pos not in placed]
@@ -257,7 +246,15 @@ async def generate_map(db: AsyncSession, game_id: int, players: list[Player]) ->
             db.add(tile)
             placed[pos] = tile
 
+    # Insert every tile in one batch, then the systems of the pre-explored
+    # tiles, which need the tile ids.
+    await db.flush()
+    db.add(_make_system(gc_tile, GALACTIC_CENTER, 0))
+    for tile in player_tiles:
+        template = ALL_TILES[tile.tile_template_id]
+        db.add(_make_system(tile, template, tile.rotation))
     await db.flush()
+
     return list(placed.values())
 
 
@@ -78,6 +78,16 @@ async def _get_hex_at(
     return result.scalar_one_or_none()
 
 
+def wormholes_face(direction: int, wormholes_a: set[int], wormholes_b: set[int]) -> bool:
+    """Return True if a wormhole leaves A in `direction` and B has the opposite one.
+
+    `direction` is the direction_between A and B, so this only applies to
+    adjacent hexes.
+    """
+    opposite = (direction + 3) % 6
+    return direction in wormholes_a and opposite in wormholes_b
+
+
 async def are_hexes_wormhole_connected(
     db: AsyncSession,
     hex_a: HexTile,
@@ -86,7 +96,7 @@ async def are_hexes_wormhole_connected(
     """Return True if hex_a and hex_b are adjacent and share a wormhole connection."""
     direction = direction_between(hex_a.q, hex_a.r, hex_b.q, hex_b.r)
     if direction is None:
-        return False  # not adjacent
+        return False  # not adjacent; skip the System lookups
 
     sys_a = await _get_system_for_hex(db, hex_a.id)
     sys_b = await _get_system_for_hex(db, hex_b.id)
@@ -94,8 +104,7 @@ async def are_hexes_wormhole_connected(
     wh_a = effective_wormholes_for_hex(hex_a, sys_a)
     wh_b = effective_wormholes_for_hex(hex_b, sys_b)
 
-    opposite = (direction + 3) % 6
-    return direction in wh_a and opposite in wh_b
+    return wormholes_face(direction, wh_a, wh_b)
 
 
 async def get_ship_movement_range(
@@ -1,9 +1,11 @@
 """Notification service: composes and dispatches emails for game events."""
 
+import asyncio
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
 from app.config import settings
 from app.models.game import Game
@@ -13,6 +15,13 @@ from app.tasks.email_sender import send_email
 
 logger = logging.getLogger(__name__)
 
+# In-flight sends. The event loop only holds weak references to tasks, so
+# keep them here until they finish.
+_pending_sends: set[asyncio.Task] = set()
+
+# Session.info key for the (to, subject, body) messages waiting on a commit.
+_QUEUED_KEY = "queued_emails"
+
 
 async def _get_user_email(db: AsyncSession, user_id: int) -> str | None:
     result = await db.execute(select(User).where(User.id == user_id))
@@ -20,6 +29,49 @@ async def _get_user_email(db: AsyncSession, user_id: int) -> str | None:
     return user.email if user else None
 
 
+async def _get_user_emails(db: AsyncSession, user_ids: list[int]) -> dict[int, str]:
+    """Map user id -> email for all of user_ids in one query."""
+    result = await db.execute(select(User.id, User.email).where(User.id.in_(user_ids)))
+    return dict(result.all())
+
+
+def _dispatch(db: AsyncSession, subject: str, messages: list[tuple[str, str]]) -> None:
+    """Queue each (to, body) message to be sent once `db` commits.
+
+    If the transaction rolls back or the session closes without committing,
+    the messages are dropped, so players are never told about a change that
+    did not happen.
+    """
+    db.info.setdefault(_QUEUED_KEY, []).extend((to, subject, body) for to, body in messages)
+
+
+@event.listens_for(Session, "after_commit")
+def _send_queued(session: Session) -> None:
+    """Start the queued sends in the background once the real commit is done.
+
+    The caller's request does not wait on SMTP. send_email logs its own
+    failures, so one bad address never affects the other sends.
+    """
+    if session.in_nested_transaction():
+        return  # only a SAVEPOINT was released; the outer transaction may still roll back
+    for to, subject, body in session.info.pop(_QUEUED_KEY, ()):
+        task = asyncio.create_task(send_email(to, subject, body))
+        _pending_sends.add(task)
+        task.add_done_callback(_pending_sends.discard)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_QUEUED_KEY, None)
+
+
+async def drain_pending_sends() -> None:
+    """Wait for every in-flight send to finish (called on app shutdown)."""
+    while _pending_sends:
+        await asyncio.gather(*_pending_sends)
+
+
 def _game_link(game: Game) -> str:
     return f"{settings.base_url}/games/{game.id}"
 
@@ -44,28 +96,29 @@ async def notify_turn_change(db: AsyncSession, game: Game, next_player: Player)
         f"Click here to play: {_game_link(game)}\n\n"
         f"Good luck!\n"
     )
-    await send_email(email, subject, body)
+    _dispatch(db, subject, [(email, body)])
 
 
 async def notify_game_started(db: AsyncSession, game: Game, players: list[Player]) -> None:
     """Send an email to every player announcing that the game has started."""
     game_link = _game_link(game)
     subject = f"Eclipse: Game '{game.name}' has started!"
+    # Only the species differs between players; the game name is user input,
+    # so it is concatenated rather than run through str.format.
+    body_head = f"Hello!\n\nThe game '{game.name}' has started!\nYou are playing as: "
+    body_tail = f"\n\nClick here to play: {game_link}\n\nGood luck!\n"
 
+    emails = await _get_user_emails(db, [p.user_id for p in players])
+    messages: list[tuple[str, str]] = []
     for player in players:
-        email = await _get_user_email(db, player.user_id)
+        email = emails.get(player.user_id)
         if not email:
             continue
 
         species_name = player.species.value if player.species else "Unknown"
-        body = (
-            f"Hello!\n\n"
-            f"The game '{game.name}' has started!\n"
-            f"You are playing as: {species_name}\n\n"
-            f"Click here to play: {game_link}\n\n"
-            f"Good luck!\n"
-        )
-        await send_email(email, subject, body)
+        messages.append((email, body_head + species_name + body_tail))
+
+    _dispatch(db, subject, messages)
 
 
 async def notify_game_ended(
@@ -84,16 +137,21 @@ async def notify_game_ended(
 
     scores = "\n".join(f"  Player {p.id}: {p.vp_count} VP" for p in players)
 
+    # Every player receives the same result summary.
+    body = (
+        f"Hello!\n\n"
+        f"The game '{game.name}' has ended!\n"
+        f"{winner_line}"
+        f"\nFinal scores:\n{scores}\n\n"
+        f"Click here to view results: {game_link}\n"
+    )
+
+    emails = await _get_user_emails(db, [p.user_id for p in players])
+    messages: list[tuple[str, str]] = []
     for player in players:
-        email = await _get_user_email(db, player.user_id)
+        email = emails.get(player.user_id)
         if not email:
             continue
+        messages.append((email, body))
 
-        body = (
-            f"Hello!\n\n"
-            f"The game '{game.name}' has ended!\n"
-            f"{winner_line}"
-            f"\nFinal scores:\n{scores}\n\n"
-            f"Click here to view results: {game_link}\n"
-        )
-        await send_email(email, subject, body)
+    _dispatch(db, subject, messages)
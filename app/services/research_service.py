@@ -8,6 +8,8 @@ Responsibilities:
   - Expose helpers used by the turn engine and the research router
 """
 
+from collections import Counter
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,7 +17,7 @@ from app.data.technologies import (
     TechCategory,
     Technology,
     get_technology,
-    list_technologies_by_category,
+    list_technologies,
 )
 from app.models.player_resources import PlayerResources
 from app.models.player_technology import PlayerTechnology
@@ -36,17 +38,18 @@ async def get_player_technologies(
 
 async def get_player_tech_ids(player_id: int, db: AsyncSession) -> set[str]:
     """Return the set of tech_ids the player currently owns."""
-    techs = await get_player_technologies(player_id, db)
-    return {t.tech_id for t in techs}
+    result = await db.scalars(
+        select(PlayerTechnology.tech_id).where(PlayerTechnology.player_id == player_id)
+    )
+    return set(result)
 
 
-async def count_techs_in_category(
-    player_id: int, category: TechCategory, db: AsyncSession
-) -> int:
-    """Return how many technologies the player owns in the given category."""
-    owned_ids = await get_player_tech_ids(player_id, db)
-    category_techs = list_technologies_by_category(category)
-    return sum(1 for t in category_techs if t.tech_id in owned_ids)
+def count_techs_by_category(owned_ids: set[str]) -> Counter[TechCategory]:
+    """Return how many of the given tech_ids fall in each category.
+
+    Ids without a technology definition are ignored.
+    """
+    return Counter(t.category for t in list_technologies() if t.tech_id in owned_ids)
 
 
 def calculate_effective_cost(tech: Technology, owned_count_in_category: int) -> int:
@@ -100,7 +103,7 @@ async def validate_research(
             )
 
     # Calculate discounted cost
-    owned_count = sum(1 for t_id in owned_ids if get_technology(t_id).category == tech.category)
+    owned_count = count_techs_by_category(owned_ids)[tech.category]
     effective_cost = calculate_effective_cost(tech, owned_count)
 
     return tech, effective_cost
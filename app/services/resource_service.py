@@ -43,6 +43,16 @@ async def get_player_resources(player_id: int, db: AsyncSession) -> PlayerResour
     return result.scalar_one_or_none()
 
 
+async def get_player_resources_bulk(
+    player_ids: list[int], db: AsyncSession
+) -> dict[int, PlayerResources]:
+    """Fetch PlayerResources for several players in one query, keyed by player_id."""
+    result = await db.execute(
+        select(PlayerResources).where(PlayerResources.player_id.in_(player_ids))
+    )
+    return {resources.player_id: resources for resources in result.scalars()}
+
+
 async def use_influence_disc(player_id: int, db: AsyncSession) -> None:
     """Place one influence disc on the board when a player takes an action.
 
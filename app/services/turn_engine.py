@@ -169,10 +169,8 @@ async def submit_action(
 
     await _advance_turn(db, game, player)
 
-    await db.commit()
-    await db.refresh(action)
-
-    # Notify the next active player (best-effort; errors are logged, not raised)
+    # Notify the next active player (best-effort; errors are logged, not raised).
+    # The email is queued now and only sent once the commit below succeeds.
     next_active = await get_active_player(db, game.id)
     if next_active:
         try:
@@ -181,6 +179,9 @@ async def submit_action(
         except Exception:
             logger.warning("Failed to send turn-change notification for game %s", game.id, exc_info=True)
 
+    await db.commit()
+    await db.refresh(action)
+
     return action
 
 
@@ -265,10 +266,9 @@ async def advance_phase(db: AsyncSession, game: Game) -> Game:
     result = await db.execute(select(Player).where(Player.game_id == game.id))
     players = list(result.scalars().all())
     await _transition_phase(db, game, players)
-    await db.commit()
-    await db.refresh(game)
 
-    # Notify the next active player after a manual phase advance (best-effort)
+    # Notify the next active player after a manual phase advance (best-effort;
+    # sent once the commit below succeeds)
     next_active = await get_active_player(db, game.id)
     if next_active:
         try:
@@ -277,4 +277,7 @@ async def advance_phase(db: AsyncSession, game: Game) -> Game:
         except Exception:
             logger.warning("Failed to send turn-change notification for game %s", game.id, exc_info=True)
 
+    await db.commit()
+    await db.refresh(game)
+
     return game
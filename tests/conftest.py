@@ -1,36 +1,146 @@
 import os
-import tempfile
+from unittest.mock import AsyncMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+from app.config import settings
 from app.database import get_db
 from app.main import app
 from app.models.base import Base
+from app.models.game import Game
+from app.models.user import User
 
+# bcrypt's minimum cost. Hash strength is irrelevant to the tests, and each
+# registration would otherwise spend a couple hundred ms of CPU on it.
+settings.bcrypt_rounds = 4
 
-@pytest.fixture
+# The suite shares one in-memory SQLite database whose schema is created once;
+# each test's writes are rolled back (see db_session). Set TEST_DB_URL to run
+# the suite against another backend (e.g. a throwaway PostgreSQL database).
+TEST_DB_URL = os.environ.get("TEST_DB_URL", "sqlite+aiosqlite:///:memory:")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Test data is disposable, so skip journaling to disk and fsync on commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (see _begin_sqlite_transaction) so that
+    # SAVEPOINTs nest correctly under the driver's transaction handling.
+    dbapi_connection.isolation_level = None
+
+
+def _begin_sqlite_transaction(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
 async def db_engine():
-    db_fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(db_fd)
-    test_db_url = f"sqlite+aiosqlite:///{db_path}"
-    engine = create_async_engine(test_db_url, connect_args={"check_same_thread": False})
+    if TEST_DB_URL.startswith("sqlite"):
+        # StaticPool hands out one shared connection, so every session sees the
+        # same in-memory database.
+        engine = create_async_engine(
+            TEST_DB_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+        event.listen(engine.sync_engine, "begin", _begin_sqlite_transaction)
+    else:
+        connect_args = {}
+        if TEST_DB_URL.startswith("postgresql+asyncpg"):
+            # Don't wait for the WAL flush on commit; test data is disposable.
+            connect_args["server_settings"] = {"synchronous_commit": "off"}
+        # Each test's session holds one connection throughout, so a pool would
+        # only add checkout bookkeeping.
+        engine = create_async_engine(TEST_DB_URL, connect_args=connect_args, poolclass=NullPool)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
-    if os.path.exists(db_path):
-        os.unlink(db_path)
+
+
+@pytest.fixture(scope="module")
+async def db_connection(db_engine):
+    """Connection whose outer transaction spans a test module and is rolled back at its end."""
+    async with db_engine.connect() as conn:
+        outer = await conn.begin()
+        yield conn
+        await outer.rollback()
+
+
+def _session_factory(conn) -> async_sessionmaker:
+    # Commits issued by tests or application code only release a SAVEPOINT,
+    # so nothing a test writes is ever durably committed.
+    return async_sessionmaker(
+        bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+    )
+
+
+def _client_for(session: AsyncSession) -> AsyncClient:
+    """HTTP client whose requests get `session` from get_db."""
+
+    async def override_get_db():
+        yield session
+
+    async def asgi(scope, receive, send):
+        # Installed per request so module- and function-scoped clients can
+        # take turns without clobbering each other's override.
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            await app(scope, receive, send)
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+    return AsyncClient(transport=ASGITransport(app=asgi), base_url="http://test")
 
 
 @pytest.fixture
-async def db_session(db_engine) -> AsyncSession:
-    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
-    async with session_factory() as session:
+async def db_session(db_connection) -> AsyncSession:
+    """Session inside a per-test SAVEPOINT that is rolled back after the test."""
+    test_savepoint = await db_connection.begin_nested()
+    async with _session_factory(db_connection)() as session:
         yield session
+    await test_savepoint.rollback()
+
+
+@pytest.fixture(autouse=True)
+def mock_send_email(monkeypatch) -> AsyncMock:
+    """Stands in for send_email in every test so no test can reach a real SMTP server.
+
+    Request it by name to inspect the (to, subject, body) calls.
+    """
+    mock = AsyncMock()
+    monkeypatch.setattr("app.services.notification_service.send_email", mock)
+    return mock
+
+
+@pytest.fixture
+async def sample_game(db_session: AsyncSession) -> Game:
+    """A persisted lobby game for model-level tests."""
+    game = Game(name="Test Game")
+    db_session.add(game)
+    await db_session.flush()
+    return game
+
+
+@pytest.fixture
+async def sample_user(db_session: AsyncSession) -> User:
+    """A persisted user for model-level tests."""
+    user = User(email="player@example.com", username="player1", hashed_password="pw")
+    db_session.add(user)
+    await db_session.flush()
+    return user
 
 
 @pytest.fixture
@@ -43,11 +153,36 @@ async def client() -> AsyncClient:
 @pytest.fixture
 async def db_client(db_session: AsyncSession) -> AsyncClient:
     """HTTP client with DB dependency overridden to use the test SQLite DB."""
+    async with _client_for(db_session) as ac:
+        yield ac
 
-    async def override_get_db():
-        yield db_session
 
-    app.dependency_overrides[get_db] = override_get_db
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+@pytest.fixture(scope="module")
+async def module_db_client(db_connection) -> AsyncClient:
+    """HTTP client for building module-scoped fixtures.
+
+    Its writes land outside the per-test SAVEPOINTs, so they are visible to
+    every later test in the module and rolled back only when the module ends.
+    Tests themselves should use db_client.
+    """
+    async with _session_factory(db_connection)() as session, _client_for(session) as ac:
         yield ac
-    app.dependency_overrides.clear()
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the suite's event loop on uvloop where it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="module")
+async def module_db_session(db_connection) -> AsyncSession:
+    """Session for building module-scoped fixtures directly through the ORM.
+
+    Commit what you build: like module_db_client's writes, it then stays
+    visible to every later test in the module and is rolled back only when
+    the module ends. Tests themselves should use db_session.
+    """
+    async with _session_factory(db_connection)() as session:
+        yield session
@@ -0,0 +1,11 @@
+"""Helpers shared by the HTTP test modules."""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# Cached per token; read-only so no caller can leak a header into later requests.
+@lru_cache(maxsize=256)
+def auth_headers(token: str) -> Mapping[str, str]:
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
@@ -1,5 +1,8 @@
 from httpx import AsyncClient
 
+from app.config import settings
+from app.services.auth_service import hash_password, verify_password
+
 
 async def register_user(client: AsyncClient, email="alice@example.com", username="alice", password="secret123"):
     return await client.post("/auth/register", json={"email": email, "username": username, "password": password})
@@ -90,3 +93,11 @@ class TestLogout:
     async def test_logout_no_token(self, db_client: AsyncClient):
         resp = await db_client.post("/auth/logout")
         assert resp.status_code == 401
+
+
+class TestPasswordHashing:
+    def test_hash_uses_configured_rounds(self):
+        hashed = hash_password("secret123")
+        assert hashed.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+        assert verify_password("secret123", hashed)
+        assert not verify_password("wrong", hashed)
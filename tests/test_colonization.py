@@ -52,18 +52,14 @@ async def _make_game_and_player(
         username=f"col_{species}_{id(db)}",
         hashed_password="x",
     )
-    db.add(user)
-    await db.flush()
-
     game = Game(
         name=f"col-game-{id(db)}",
         status=GameStatus.active,
         max_players=2,
         current_round=1,
         current_phase=GamePhase.activation,
-        host_user_id=user.id,
     )
-    db.add(game)
+    db.add_all([user, game])
     await db.flush()
 
     player = Player(
@@ -775,8 +771,6 @@ async def test_api_colonize_action_rejected_without_colony_ship(db_client, db_se
     tokens, game_id = await _setup_two_player_game(db_client)
 
     # Find the active player
-    from app.models.player import Player
-
     player_result = await db_session.execute(
         select(Player).where(Player.game_id == game_id, Player.is_active_turn == True)  # noqa: E712
     )
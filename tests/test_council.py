@@ -19,6 +19,7 @@ Covers:
 - GET /resolutions returns all resolution cards
 """
 
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -42,17 +43,19 @@ from app.services.council_service import (
     tally_votes,
 )
 
+from tests.helpers import auth_headers
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-SPECIES_CYCLE = [
+SPECIES_CYCLE = (
     "human",
     "planta",
     "mechanema",
     "orion_hegemony",
-]
+)
 
 
 async def register_and_login(
@@ -66,10 +69,6 @@ async def register_and_login(
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
-
-
 async def setup_started_game(
     client: AsyncClient, num_players: int = 2
 ) -> tuple[list[str], dict]:
@@ -28,6 +28,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.game import Game, GamePhase, GameStatus
 from app.models.game_action import ActionType
+from app.models.hex_tile import HexTile
 from app.models.player import Player, Species
 from app.models.user import User
 from app.services.game_service import (
@@ -315,7 +316,6 @@ class TestStartGameDirect:
 
     async def test_start_game_creates_map_tiles(self, db_session: AsyncSession):
         from sqlalchemy import select as sql_select
-        from app.models.hex_tile import HexTile
 
         game, host, joiner, player_a, player_b = await _make_game_with_two_players(
             db_session, "start5"
@@ -376,7 +376,6 @@ class TestGenerateMapDirect:
 
     async def test_generate_map_2_players(self, db_session: AsyncSession):
         from sqlalchemy import select as sql_select
-        from app.models.hex_tile import HexTile
 
         game, players = await self._create_game_with_players(
             db_session, "2p", 2, [Species.human, Species.planta]
@@ -396,7 +395,6 @@ class TestGenerateMapDirect:
 
     async def test_generate_map_3_players(self, db_session: AsyncSession):
         from sqlalchemy import select as sql_select
-        from app.models.hex_tile import HexTile
 
         game, players = await self._create_game_with_players(
             db_session,
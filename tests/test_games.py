@@ -1,5 +1,7 @@
 from httpx import AsyncClient
 
+from tests.helpers import auth_headers
+
 
 # ---- helpers ----------------------------------------------------------------
 
@@ -9,10 +11,6 @@ async def register_and_login(client: AsyncClient, email: str, username: str, pas
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
-
-
 async def create_game(client: AsyncClient, token: str, name: str = "Test Game", max_players: int = 4) -> dict:
     resp = await client.post(
         "/games",
@@ -129,6 +127,7 @@ class TestGetGame:
         resp = await db_client.get(f"/games/{game['id']}", headers=auth_headers(token))
         assert resp.status_code == 200
         assert resp.json()["name"] == "My Game"
+        assert resp.json()["active_player_id"] is None
 
     async def test_get_game_not_found(self, db_client: AsyncClient):
         token = await register_and_login(db_client, "g2@example.com", "guser2")
@@ -440,6 +439,12 @@ class TestStartGame:
         assert data["status"] == "active"
         assert data["current_round"] == 1
 
+        game_resp = await db_client.get(f"/games/{game['id']}", headers=auth_headers(host_token))
+        game_data = game_resp.json()
+        active_players = [p for p in game_data["players"] if p["is_active_turn"]]
+        assert len(active_players) == 1
+        assert game_data["active_player_id"] == active_players[0]["id"]
+
     async def test_start_game_non_host_rejected(self, db_client: AsyncClient):
         host_token = await register_and_login(db_client, "st3h@example.com", "st3host")
         p2_token = await register_and_login(db_client, "st3p@example.com", "st3player")
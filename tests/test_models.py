@@ -1,13 +1,22 @@
 """Unit tests for database models: User, Game, Player, GameInvite."""
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.exc import IntegrityError
 
 from app.models.game import Game, GamePhase, GameStatus
 from app.models.game_invite import GameInvite
 from app.models.player import Player, Species
 from app.models.user import User
 
+# Column values shared by users that tests insert directly with insert(User).
+_USER_TMPL = {"hashed_password": "pw"}
+
+# Statements reused across tests/parametrized cases; values are bound per call.
+_SEL_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SEL_GAME_STATUS = select(Game.status).where(Game.id == bindparam("game_id"))
+_SEL_GAME_PHASE = select(Game.current_phase).where(Game.id == bindparam("game_id"))
+
 
 class TestUserModel:
     async def test_create_user(self, db_session):
@@ -17,8 +26,7 @@ class TestUserModel:
             hashed_password="hashed_pw",
         )
         db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
+        await db_session.flush()
 
         assert user.id is not None
         assert user.email == "alice@example.com"
@@ -27,39 +35,40 @@ class TestUserModel:
         assert user.created_at is not None
 
     async def test_read_user(self, db_session):
-        user = User(email="bob@example.com", username="bob", hashed_password="pw2")
-        db_session.add(user)
-        await db_session.commit()
+        await db_session.execute(
+            insert(User), [_USER_TMPL | {"email": "bob@example.com", "username": "bob"}]
+        )
 
-        result = await db_session.execute(select(User).where(User.email == "bob@example.com"))
+        result = await db_session.execute(_SEL_USER_BY_EMAIL, {"email": "bob@example.com"})
         fetched = result.scalar_one()
         assert fetched.username == "bob"
 
     async def test_user_email_unique(self, db_session):
-        user1 = User(email="dup@example.com", username="dup1", hashed_password="pw")
-        user2 = User(email="dup@example.com", username="dup2", hashed_password="pw")
-        db_session.add(user1)
-        await db_session.commit()
-        db_session.add(user2)
-        with pytest.raises(Exception):
-            await db_session.commit()
+        await db_session.execute(
+            insert(User), [_USER_TMPL | {"email": "dup@example.com", "username": "dup1"}]
+        )
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                await db_session.execute(
+                    insert(User), [_USER_TMPL | {"email": "dup@example.com", "username": "dup2"}]
+                )
 
     async def test_user_username_unique(self, db_session):
-        user1 = User(email="u1@example.com", username="sameuser", hashed_password="pw")
-        user2 = User(email="u2@example.com", username="sameuser", hashed_password="pw")
-        db_session.add(user1)
-        await db_session.commit()
-        db_session.add(user2)
-        with pytest.raises(Exception):
-            await db_session.commit()
+        await db_session.execute(
+            insert(User), [_USER_TMPL | {"email": "u1@example.com", "username": "sameuser"}]
+        )
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                await db_session.execute(
+                    insert(User), [_USER_TMPL | {"email": "u2@example.com", "username": "sameuser"}]
+                )
 
 
 class TestGameModel:
     async def test_create_game_defaults(self, db_session):
         game = Game(name="My Game")
         db_session.add(game)
-        await db_session.commit()
-        await db_session.refresh(game)
+        await db_session.flush()
 
         assert game.id is not None
         assert game.name == "My Game"
@@ -78,62 +87,38 @@ class TestGameModel:
             max_players=6,
         )
         db_session.add(game)
-        await db_session.commit()
-        await db_session.refresh(game)
+        await db_session.flush()
 
         assert game.status == GameStatus.active
         assert game.current_round == 3
         assert game.current_phase == GamePhase.combat
         assert game.max_players == 6
 
-    async def test_game_status_values(self, db_session):
-        for status in GameStatus:
-            game = Game(name=f"game_{status.value}", status=status)
-            db_session.add(game)
-        await db_session.commit()
-
-        result = await db_session.execute(select(Game))
-        games = result.scalars().all()
-        statuses = {g.status for g in games}
-        assert GameStatus.lobby in statuses
-        assert GameStatus.active in statuses
-        assert GameStatus.finished in statuses
-
-    async def test_game_phase_values(self, db_session):
-        for phase in GamePhase:
-            game = Game(
-                name=f"game_phase_{phase.value}",
-                current_phase=phase,
-            )
-            db_session.add(game)
-        await db_session.commit()
+    @pytest.mark.parametrize("status", list(GameStatus))
+    async def test_game_status_values(self, db_session, status):
+        game_id = await db_session.scalar(
+            insert(Game).values(name=f"game_{status.value}", status=status).returning(Game.id)
+        )
 
-        result = await db_session.execute(select(Game).where(Game.current_phase.isnot(None)))
-        games = result.scalars().all()
-        phases = {g.current_phase for g in games}
-        assert GamePhase.strategy in phases
-        assert GamePhase.activation in phases
-        assert GamePhase.combat in phases
-        assert GamePhase.upkeep in phases
+        assert await db_session.scalar(_SEL_GAME_STATUS, {"game_id": game_id}) == status
 
+    @pytest.mark.parametrize("phase", list(GamePhase))
+    async def test_game_phase_values(self, db_session, phase):
+        game_id = await db_session.scalar(
+            insert(Game)
+            .values(name=f"game_phase_{phase.value}", current_phase=phase)
+            .returning(Game.id)
+        )
+
+        assert await db_session.scalar(_SEL_GAME_PHASE, {"game_id": game_id}) == phase
 
-class TestPlayerModel:
-    async def _create_game_and_user(self, db_session):
-        game = Game(name="Test Game")
-        user = User(email="player@example.com", username="player1", hashed_password="pw")
-        db_session.add(game)
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(game)
-        await db_session.refresh(user)
-        return game, user
 
-    async def test_create_player_defaults(self, db_session):
-        game, user = await self._create_game_and_user(db_session)
+class TestPlayerModel:
+    async def test_create_player_defaults(self, db_session, sample_game, sample_user):
+        game, user = sample_game, sample_user
         player = Player(game_id=game.id, user_id=user.id)
         db_session.add(player)
-        await db_session.commit()
-        await db_session.refresh(player)
+        await db_session.flush()
 
         assert player.id is not None
         assert player.game_id == game.id
@@ -143,8 +128,8 @@ class TestPlayerModel:
         assert player.is_active_turn is False
         assert player.vp_count == 0
 
-    async def test_create_player_with_species(self, db_session):
-        game, user = await self._create_game_and_user(db_session)
+    async def test_create_player_with_species(self, db_session, sample_game, sample_user):
+        game, user = sample_game, sample_user
         player = Player(
             game_id=game.id,
             user_id=user.id,
@@ -154,8 +139,7 @@ class TestPlayerModel:
             vp_count=5,
         )
         db_session.add(player)
-        await db_session.commit()
-        await db_session.refresh(player)
+        await db_session.flush()
 
         assert player.species == Species.human
         assert player.turn_order == 1
@@ -165,60 +149,56 @@ class TestPlayerModel:
     async def test_all_species_values(self, db_session):
         game = Game(name="Species Test Game")
         db_session.add(game)
-        await db_session.commit()
-        await db_session.refresh(game)
-
-        for i, species in enumerate(Species):
-            user = User(
-                email=f"species_{i}@example.com",
-                username=f"species_user_{i}",
-                hashed_password="pw",
+        await db_session.flush()
+
+        user_ids = (
+            await db_session.scalars(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                [
+                    _USER_TMPL
+                    | {"email": f"species_{i}@example.com", "username": f"species_user_{i}"}
+                    for i in range(len(Species))
+                ],
             )
-            db_session.add(user)
-            await db_session.commit()
-            await db_session.refresh(user)
-
-            player = Player(game_id=game.id, user_id=user.id, species=species)
-            db_session.add(player)
-        await db_session.commit()
+        ).all()
+        await db_session.execute(
+            insert(Player),
+            [
+                {"game_id": game.id, "user_id": user_id, "species": species}
+                for user_id, species in zip(user_ids, Species)
+            ],
+        )
 
-        result = await db_session.execute(
-            select(Player).where(Player.game_id == game.id)
+        species = await db_session.scalars(
+            select(Player.species).where(Player.game_id == game.id).distinct()
         )
-        players = result.scalars().all()
-        assert len(players) == len(Species)
+        assert set(species) == set(Species)
 
-    async def test_player_foreign_keys(self, db_session):
-        game, user = await self._create_game_and_user(db_session)
-        player = Player(game_id=game.id, user_id=user.id)
-        db_session.add(player)
-        await db_session.commit()
+        count = await db_session.scalar(
+            select(func.count()).select_from(Player).where(Player.game_id == game.id)
+        )
+        assert count == len(Species)
 
+    async def test_player_foreign_keys(self, db_session, sample_game, sample_user):
+        game, user = sample_game, sample_user
         result = await db_session.execute(
-            select(Player).where(Player.game_id == game.id)
+            insert(Player)
+            .values(game_id=game.id, user_id=user.id)
+            .returning(Player.game_id, Player.user_id)
         )
-        fetched = result.scalar_one()
-        assert fetched.user_id == user.id
+        assert result.one() == (game.id, user.id)
 
 
 class TestGameInviteModel:
-    async def _create_game(self, db_session):
-        game = Game(name="Invite Game")
-        db_session.add(game)
-        await db_session.commit()
-        await db_session.refresh(game)
-        return game
-
-    async def test_create_invite_defaults(self, db_session):
-        game = await self._create_game(db_session)
+    async def test_create_invite_defaults(self, db_session, sample_game):
+        game = sample_game
         invite = GameInvite(
             game_id=game.id,
             invitee_email="newplayer@example.com",
             token="unique-token-123",
         )
         db_session.add(invite)
-        await db_session.commit()
-        await db_session.refresh(invite)
+        await db_session.flush()
 
         assert invite.id is not None
         assert invite.game_id == game.id
@@ -226,8 +206,8 @@ class TestGameInviteModel:
         assert invite.token == "unique-token-123"
         assert invite.accepted is False
 
-    async def test_invite_accepted(self, db_session):
-        game = await self._create_game(db_session)
+    async def test_invite_accepted(self, db_session, sample_game):
+        game = sample_game
         invite = GameInvite(
             game_id=game.id,
             invitee_email="accepted@example.com",
@@ -235,35 +215,32 @@ class TestGameInviteModel:
             accepted=True,
         )
         db_session.add(invite)
-        await db_session.commit()
-        await db_session.refresh(invite)
+        await db_session.flush()
 
         assert invite.accepted is True
 
-    async def test_invite_token_unique(self, db_session):
-        game = await self._create_game(db_session)
-        invite1 = GameInvite(
-            game_id=game.id, invitee_email="a@example.com", token="same-token"
+    async def test_invite_token_unique(self, db_session, sample_game):
+        game = sample_game
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                await db_session.execute(
+                    insert(GameInvite),
+                    [
+                        {"game_id": game.id, "invitee_email": "a@example.com", "token": "same-token"},
+                        {"game_id": game.id, "invitee_email": "b@example.com", "token": "same-token"},
+                    ],
+                )
+
+        count = await db_session.scalar(
+            select(func.count()).select_from(GameInvite).where(GameInvite.token == "same-token")
         )
-        invite2 = GameInvite(
-            game_id=game.id, invitee_email="b@example.com", token="same-token"
-        )
-        db_session.add(invite1)
-        await db_session.commit()
-        db_session.add(invite2)
-        with pytest.raises(Exception):
-            await db_session.commit()
-
-    async def test_invite_foreign_key(self, db_session):
-        game = await self._create_game(db_session)
-        invite = GameInvite(
-            game_id=game.id, invitee_email="fk@example.com", token="fk-token"
-        )
-        db_session.add(invite)
-        await db_session.commit()
+        assert count == 0
 
+    async def test_invite_foreign_key(self, db_session, sample_game):
+        game = sample_game
         result = await db_session.execute(
-            select(GameInvite).where(GameInvite.game_id == game.id)
+            insert(GameInvite)
+            .values(game_id=game.id, invitee_email="fk@example.com", token="fk-token")
+            .returning(GameInvite.game_id, GameInvite.invitee_email)
         )
-        fetched = result.scalar_one()
-        assert fetched.invitee_email == "fk@example.com"
+        assert result.one() == (game.id, "fk@example.com")
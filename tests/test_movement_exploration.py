@@ -7,18 +7,23 @@ Covers:
 - EXPLORE action: reveals tile, places ancient ships, draws discovery tile
 - INFLUENCE action: claim explored hex with ship, reject without ship, reject already owned
 - GET /games/{id}/map endpoint: returns all tiles with state
-- movement_service: direction_between, are_hexes_wormhole_connected helpers
+- movement_service: direction_between, wormholes_face, are_hexes_wormhole_connected helpers
 """
 
+import itertools
+import re
+from collections.abc import Sequence
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.data.discovery_tiles import (
     DISCOVERY_TILE_TEMPLATES,
     get_discovery_tile,
 )
+from app.data.system_tiles import ALL_TILES
 from app.models.discovery_tile import DiscoveryTile
 from app.models.game import Game, GamePhase, GameStatus
 from app.models.hex_tile import HexTile, TileType
@@ -40,8 +45,11 @@ from app.services.movement_service import (
     are_hexes_wormhole_connected,
     direction_between,
     validate_and_execute_move,
+    wormholes_face,
 )
 
+from tests.helpers import auth_headers
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -58,23 +66,62 @@ async def register_and_login(
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
+SPECIES_CYCLE = ("human", "planta", "mechanema", "orion_hegemony")
+
+# Error messages validate_and_execute_move raises for each rejected MOVE.
+_ERR_EMPTY = re.compile("at least one destination")
+_ERR_NOT_FOUND = re.compile("not found")
+_ERR_NOT_OWNED = re.compile("do not own")
+_ERR_IMMOBILE = re.compile("immobile")
+_ERR_UNEXPLORED = re.compile("unexplored")
+_ERR_NO_WORMHOLE = re.compile("No wormhole connection")
+_ERR_RANGE = re.compile("movement range")
 
+# Keys every GET /games/{id}/map entry carries.
+MAP_TILE_FIELDS = frozenset(
+    {"id", "q", "r", "tile_type", "is_explored", "owner_player_id", "system", "ships"}
+)
 
-SPECIES_CYCLE = ["human", "planta", "mechanema", "orion_hegemony"]
+# Suffix source for unique, deterministic emails/usernames/game names.
+_UID_COUNTER = itertools.count()
+
+# Discovery templates partitioned once for the static-data assertions.
+TEMPLATES_BY_EFFECT: dict[str, list] = {
+    effect: [t for t in DISCOVERY_TILE_TEMPLATES if t.effect_type == effect]
+    for effect in {t.effect_type for t in DISCOVERY_TILE_TEMPLATES}
+}
+TEMPLATES_BY_POLARITY: dict[bool, list] = {
+    positive: [t for t in DISCOVERY_TILE_TEMPLATES if t.positive is positive]
+    for positive in (True, False)
+}
+DISCOVERY_IDS = {t.discovery_id for t in DISCOVERY_TILE_TEMPLATES}
+# Fixed draw order for tests that don't exercise the shuffle.
+DISCOVERY_ORDER = [t.discovery_id for t in DISCOVERY_TILE_TEMPLATES]
+NUM_DISCOVERY_TEMPLATES = len(DISCOVERY_TILE_TEMPLATES)
+
+# (template_id, template) pairs keyed by unrotated wormhole direction: inner
+# tiles, and tiles of any category that start with ancient ships.
+INNER_TILES_BY_WORMHOLE_DIR: dict[int, list] = {}
+ANCIENT_TILES_BY_WORMHOLE_DIR: dict[int, list] = {}
+for _tid, _tmpl in ALL_TILES.items():
+    for _direction in _tmpl.wormholes:
+        if _tmpl.tile_category == "inner":
+            INNER_TILES_BY_WORMHOLE_DIR.setdefault(_direction, []).append((_tid, _tmpl))
+        if _tmpl.ancient_ships_count > 0:
+            ANCIENT_TILES_BY_WORMHOLE_DIR.setdefault(_direction, []).append((_tid, _tmpl))
 
 
 async def setup_started_game(
-    client: AsyncClient, num_players: int = 2, species_list: list[str] | None = None
+    client: AsyncClient, num_players: int = 2, species_list: Sequence[str] | None = None
 ) -> tuple[list[str], dict]:
     """Create, populate, and start a game. Returns (tokens, game_dict)."""
     if species_list is None:
         species_list = SPECIES_CYCLE[:num_players]
 
     tokens = []
-    emails = [f"mov_p{i}_{id(client)}@example.com" for i in range(num_players)]
-    usernames = [f"mov_player{i}_{id(client)}" for i in range(num_players)]
+    uid = next(_UID_COUNTER)
+    emails = [f"mov_p{i}_{uid}@example.com" for i in range(num_players)]
+    usernames = [f"mov_player{i}_{uid}" for i in range(num_players)]
 
     for i in range(num_players):
         token = await register_and_login(client, emails[i], usernames[i])
@@ -82,7 +129,7 @@ async def setup_started_game(
 
     create_resp = await client.post(
         "/games",
-        json={"name": f"Move Test {id(client)}", "max_players": num_players},
+        json={"name": f"Move Test {uid}", "max_players": num_players},
         headers=auth_headers(tokens[0]),
     )
     assert create_resp.status_code == 201
@@ -115,27 +162,30 @@ async def setup_started_game(
     return tokens, start_resp.json()
 
 
+@pytest.fixture(scope="module")
+async def started_game_2p(module_db_client: AsyncClient) -> tuple[list[str], dict]:
+    """A started 2-player game shared by the API tests that only read it or are rejected."""
+    return await setup_started_game(module_db_client, num_players=2)
+
+
 async def _make_minimal_game_and_player(
     db: AsyncSession, species: str = "human"
-) -> tuple[Game, Player]:
-    """Create a minimal active game and one player for unit tests."""
+) -> tuple[Game, Player, PlayerResources]:
+    """Create a minimal active game and one player (with resources) for unit tests."""
+    uid = next(_UID_COUNTER)
     user = User(
-        email=f"unit_{species}_{id(db)}@test.com",
-        username=f"unit_{species}_{id(db)}",
+        email=f"unit_{species}_{uid}@test.com",
+        username=f"unit_{species}_{uid}",
         hashed_password="x",
     )
-    db.add(user)
-    await db.flush()
-
     game = Game(
-        name=f"unit-game-{id(db)}",
+        name=f"unit-game-{uid}",
         status=GameStatus.active,
         max_players=2,
         current_round=1,
         current_phase=GamePhase.activation,
-        host_user_id=user.id,
     )
-    db.add(game)
+    db.add_all([user, game])
     await db.flush()
 
     player = Player(
@@ -155,10 +205,52 @@ async def _make_minimal_game_and_player(
         influence_discs_total=11,
         influence_discs_used=1,  # one disc used for turn
     )
+    # Nothing here needs the resources id, so the row is written by the
+    # caller's next flush (or autoflush) instead of a flush of its own.
     db.add(resources)
-    await db.flush()
 
-    return game, player
+    return game, player, resources
+
+
+async def _make_explored_hexes(
+    db: AsyncSession,
+    game_id: int,
+    specs: list[tuple[int, int, list[int]]],
+    owner_player_id: int | None = None,
+) -> list[tuple[HexTile, System]]:
+    """Create explored hexes from (q, r, wormholes) specs with one INSERT per table."""
+    hex_tiles = (
+        await db.scalars(
+            insert(HexTile).returning(HexTile, sort_by_parameter_order=True),
+            [
+                {
+                    "game_id": game_id,
+                    "q": q,
+                    "r": r,
+                    "tile_type": TileType.inner,
+                    "is_explored": True,
+                    "owner_player_id": owner_player_id,
+                }
+                for q, r, _ in specs
+            ],
+        )
+    ).all()
+    systems = (
+        await db.scalars(
+            insert(System).returning(System, sort_by_parameter_order=True),
+            [
+                {
+                    "hex_tile_id": hex_tile.id,
+                    "name": f"System ({hex_tile.q},{hex_tile.r})",
+                    "planets": [],
+                    "wormholes": wormholes,
+                    "ancient_ships_count": 0,
+                }
+                for hex_tile, (_, _, wormholes) in zip(hex_tiles, specs)
+            ],
+        )
+    ).all()
+    return list(zip(hex_tiles, systems))
 
 
 async def _make_explored_hex(
@@ -169,26 +261,9 @@ async def _make_explored_hex(
     wormholes: list[int],
     owner_player_id: int | None = None,
 ) -> tuple[HexTile, System]:
-    hex_tile = HexTile(
-        game_id=game_id,
-        q=q,
-        r=r,
-        tile_type=TileType.inner,
-        is_explored=True,
-        owner_player_id=owner_player_id,
-    )
-    db.add(hex_tile)
-    await db.flush()
-
-    system = System(
-        hex_tile_id=hex_tile.id,
-        name=f"System ({q},{r})",
-        planets=[],
-        wormholes=wormholes,
-        ancient_ships_count=0,
+    ((hex_tile, system),) = await _make_explored_hexes(
+        db, game_id, [(q, r, wormholes)], owner_player_id=owner_player_id
     )
-    db.add(system)
-    await db.flush()
     return hex_tile, system
 
 
@@ -214,6 +289,29 @@ async def _make_unexplored_hex(
     return hex_tile
 
 
+async def _make_ships(
+    db: AsyncSession,
+    game_id: int,
+    player_id: int,
+    specs: list[dict],
+) -> list[Ship]:
+    """Create ships from specs (hex_tile_id, optional ship_type/is_ancient) with one flush."""
+    ships = [
+        Ship(
+            game_id=game_id,
+            player_id=None if spec.get("is_ancient", False) else player_id,
+            ship_type=spec.get("ship_type", "interceptor"),
+            hex_tile_id=spec["hex_tile_id"],
+            hp_remaining=1,
+            is_ancient=spec.get("is_ancient", False),
+        )
+        for spec in specs
+    ]
+    db.add_all(ships)
+    await db.flush()
+    return ships
+
+
 async def _make_ship(
     db: AsyncSession,
     game_id: int,
@@ -222,46 +320,125 @@ async def _make_ship(
     ship_type: str = "interceptor",
     is_ancient: bool = False,
 ) -> Ship:
-    ship = Ship(
-        game_id=game_id,
-        player_id=player_id if not is_ancient else None,
-        ship_type=ship_type,
-        hex_tile_id=hex_tile_id,
-        hp_remaining=1,
-        is_ancient=is_ancient,
+    (ship,) = await _make_ships(
+        db,
+        game_id,
+        player_id,
+        [{"hex_tile_id": hex_tile_id, "ship_type": ship_type, "is_ancient": is_ancient}],
     )
-    db.add(ship)
-    await db.flush()
     return ship
 
 
+async def _make_explore_scene(
+    db: AsyncSession,
+    game_id: int,
+    player_id: int,
+    target_q: int = 1,
+    target_r: int = 0,
+    template_id: str = "inner_001",
+    source_wormholes: list[int] | None = None,
+    source_owner_id: int | None = None,
+) -> tuple[HexTile, HexTile, Ship]:
+    """Source hex (0,0) holding the player's interceptor, plus an unexplored target.
+
+    Both hexes go in one INSERT, so the scene costs one round-trip per table.
+    """
+    source, target = (
+        await db.scalars(
+            insert(HexTile).returning(HexTile, sort_by_parameter_order=True),
+            [
+                {
+                    "game_id": game_id,
+                    "q": 0,
+                    "r": 0,
+                    "tile_type": TileType.inner,
+                    "is_explored": True,
+                    "owner_player_id": source_owner_id,
+                    "tile_template_id": None,
+                    "rotation": 0,
+                },
+                {
+                    "game_id": game_id,
+                    "q": target_q,
+                    "r": target_r,
+                    "tile_type": TileType.inner,
+                    "is_explored": False,
+                    "owner_player_id": None,
+                    "tile_template_id": template_id,
+                    "rotation": 0,
+                },
+            ],
+        )
+    ).all()
+    db.add(
+        System(
+            hex_tile_id=source.id,
+            name="System (0,0)",
+            planets=[],
+            wormholes=[0] if source_wormholes is None else source_wormholes,
+            ancient_ships_count=0,
+        )
+    )
+    ship = await _make_ship(db, game_id, player_id, source.id)
+    return source, target, ship
+
+
+@pytest.fixture(scope="module")
+async def move_scenario(module_db_session: AsyncSession) -> dict:
+    """Board shared by the MOVE error-path tests, built once per module.
+
+    hex_a (0,0) holds an interceptor and a starbase. Its only wormholes face
+    away from hex_b (1,0), which continues to hex_c (2,0). The unexplored hex
+    sits at (0,1).
+    """
+    db = module_db_session
+    game, player, _ = await _make_minimal_game_and_player(db)
+    (hex_a, _), (hex_b, _), (hex_c, _) = await _make_explored_hexes(
+        db, game.id, [(0, 0, [2, 3]), (1, 0, [0, 3]), (2, 0, [0, 3])]
+    )
+    unexplored = await _make_unexplored_hex(db, game.id, 0, 1)
+    ship, starbase = await _make_ships(
+        db,
+        game.id,
+        player.id,
+        [{"hex_tile_id": hex_a.id}, {"hex_tile_id": hex_a.id, "ship_type": "starbase"}],
+    )
+    await db.commit()
+    return {
+        "game": game,
+        "player": player,
+        "hex_b": hex_b,
+        "hex_c": hex_c,
+        "unexplored": unexplored,
+        "ship": ship,
+        "starbase": starbase,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Discovery tile static data tests
 # ---------------------------------------------------------------------------
 
 class TestDiscoveryTileStaticData:
     def test_eighteen_templates_defined(self):
-        assert len(DISCOVERY_TILE_TEMPLATES) == 18
+        assert NUM_DISCOVERY_TEMPLATES == 18
 
     def test_all_have_unique_ids(self):
-        ids = [t.discovery_id for t in DISCOVERY_TILE_TEMPLATES]
-        assert len(ids) == len(set(ids))
+        assert len(DISCOVERY_IDS) == NUM_DISCOVERY_TEMPLATES
 
     def test_all_effect_types_valid(self):
         valid_types = {"money", "science", "materials", "ancient_cruiser", "orbital", "empty"}
-        for t in DISCOVERY_TILE_TEMPLATES:
-            assert t.effect_type in valid_types, (
-                f"{t.discovery_id} has invalid effect_type '{t.effect_type}'"
-            )
+        invalid = TEMPLATES_BY_EFFECT.keys() - valid_types
+        assert not invalid, f"invalid effect types: {sorted(invalid)}"
 
     def test_money_tiles_have_positive_value(self):
-        money_tiles = [t for t in DISCOVERY_TILE_TEMPLATES if t.effect_type == "money"]
+        money_tiles = TEMPLATES_BY_EFFECT["money"]
         assert len(money_tiles) >= 1
         for t in money_tiles:
             assert t.effect_value > 0
 
     def test_empty_tiles_have_zero_value(self):
-        empty_tiles = [t for t in DISCOVERY_TILE_TEMPLATES if t.effect_type == "empty"]
+        empty_tiles = TEMPLATES_BY_EFFECT["empty"]
         assert len(empty_tiles) >= 1
         for t in empty_tiles:
             assert t.effect_value == 0
@@ -276,10 +453,8 @@ class TestDiscoveryTileStaticData:
             get_discovery_tile("nonexistent_disc_xyz")
 
     def test_mix_of_positive_and_empty_tiles(self):
-        positive = [t for t in DISCOVERY_TILE_TEMPLATES if t.positive]
-        empty = [t for t in DISCOVERY_TILE_TEMPLATES if not t.positive]
-        assert len(positive) > 0
-        assert len(empty) > 0
+        assert len(TEMPLATES_BY_POLARITY[True]) > 0
+        assert len(TEMPLATES_BY_POLARITY[False]) > 0
 
 
 # ---------------------------------------------------------------------------
@@ -287,31 +462,31 @@ class TestDiscoveryTileStaticData:
 # ---------------------------------------------------------------------------
 
 class TestDirectionBetween:
-    def test_east_is_direction_0(self):
-        assert direction_between(0, 0, 1, 0) == 0
-
-    def test_northeast_is_direction_1(self):
-        assert direction_between(0, 0, 1, -1) == 1
-
-    def test_northwest_is_direction_2(self):
-        assert direction_between(0, 0, 0, -1) == 2
-
-    def test_west_is_direction_3(self):
-        assert direction_between(0, 0, -1, 0) == 3
-
-    def test_southwest_is_direction_4(self):
-        assert direction_between(0, 0, -1, 1) == 4
-
-    def test_southeast_is_direction_5(self):
-        assert direction_between(0, 0, 0, 1) == 5
-
-    def test_non_adjacent_returns_none(self):
-        assert direction_between(0, 0, 2, 0) is None
-        assert direction_between(0, 0, 0, 2) is None
-        assert direction_between(0, 0, 3, 3) is None
+    @pytest.mark.parametrize(
+        "dq,dr,expected",
+        [
+            pytest.param(1, 0, 0, id="east"),
+            pytest.param(1, -1, 1, id="northeast"),
+            pytest.param(0, -1, 2, id="northwest"),
+            pytest.param(-1, 0, 3, id="west"),
+            pytest.param(-1, 1, 4, id="southwest"),
+            pytest.param(0, 1, 5, id="southeast"),
+            pytest.param(2, 0, None, id="non_adjacent_east"),
+            pytest.param(0, 2, None, id="non_adjacent_south"),
+            pytest.param(3, 3, None, id="non_adjacent_diagonal"),
+            pytest.param(0, 0, None, id="same_hex"),
+        ],
+    )
+    def test_direction_between(self, dq, dr, expected):
+        assert direction_between(0, 0, dq, dr) == expected
 
-    def test_same_hex_returns_none(self):
-        assert direction_between(0, 0, 0, 0) is None
+    def test_only_unit_offsets_are_adjacent(self):
+        # Every offset in a radius-3 box, from several origins: adjacency holds
+        # exactly for the six axial unit vectors and is translation-invariant.
+        unit = {(1, 0): 0, (1, -1): 1, (0, -1): 2, (-1, 0): 3, (-1, 1): 4, (0, 1): 5}
+        for q0, r0 in [(0, 0), (2, -1), (-3, 4)]:
+            for dq, dr in itertools.product(range(-3, 4), repeat=2):
+                assert direction_between(q0, r0, q0 + dq, r0 + dr) == unit.get((dq, dr))
 
 
 # ---------------------------------------------------------------------------
@@ -319,38 +494,42 @@ class TestDirectionBetween:
 # ---------------------------------------------------------------------------
 
 class TestWormholeConnected:
-    async def test_connected_hexes_with_aligned_wormholes(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
-        # Hex A at (0,0) has wormhole in direction 0 (East)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        # Hex B at (1,0) has wormhole in direction 3 (West = opposite of 0)
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[3])
-
-        connected = await are_hexes_wormhole_connected(db_session, hex_a, hex_b)
-        assert connected is True
+    @pytest.mark.parametrize(
+        "direction,wormholes_a,wormholes_b,expected",
+        [
+            # A faces East (0), B to its East faces West (3)
+            pytest.param(0, {0}, {3}, True, id="aligned"),
+            pytest.param(4, {4}, {1}, True, id="aligned_wraps"),
+            pytest.param(0, {2, 3}, {3}, False, id="no_wormhole_on_a"),
+            pytest.param(0, {0}, {0, 1, 2}, False, id="no_wormhole_on_b"),
+        ],
+    )
+    def test_wormholes_face(self, direction, wormholes_a, wormholes_b, expected):
+        assert wormholes_face(direction, wormholes_a, wormholes_b) is expected
 
-    async def test_not_connected_no_wormhole_on_a(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
-        # Hex A has no wormhole facing East
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[2, 3])
-        # Hex B has wormhole facing West
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[3])
+    async def test_connected_hexes_with_aligned_wormholes(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
+        (hex_a, _), (hex_b, _) = await _make_explored_hexes(
+            db_session, game.id, [(0, 0, [0]), (1, 0, [3])]
+        )
 
         connected = await are_hexes_wormhole_connected(db_session, hex_a, hex_b)
-        assert connected is False
+        assert connected is True
 
-    async def test_not_connected_no_wormhole_on_b(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[0, 1, 2])
+    async def test_not_connected_no_wormhole_on_a(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
+        (hex_a, _), (hex_b, _) = await _make_explored_hexes(
+            db_session, game.id, [(0, 0, [2, 3]), (1, 0, [3])]
+        )
 
         connected = await are_hexes_wormhole_connected(db_session, hex_a, hex_b)
         assert connected is False
 
-    async def test_non_adjacent_hexes_not_connected(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0, 1, 2, 3, 4, 5])
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 2, 0, wormholes=[0, 1, 2, 3, 4, 5])
+    async def test_not_connected_when_not_adjacent(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
+        (hex_a, _), (hex_b, _) = await _make_explored_hexes(
+            db_session, game.id, [(0, 0, list(range(6))), (2, 0, list(range(6)))]
+        )
 
         connected = await are_hexes_wormhole_connected(db_session, hex_a, hex_b)
         assert connected is False
@@ -362,10 +541,11 @@ class TestWormholeConnected:
 
 class TestValidateAndExecuteMove:
     async def test_valid_move_updates_ship_position(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
 
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[3])
+        (hex_a, _), (hex_b, _) = await _make_explored_hexes(
+            db_session, game.id, [(0, 0, [0]), (1, 0, [3])]
+        )
 
         # Give the player a blueprint so movement range defaults to 1
         bp = ShipBlueprint(
@@ -388,107 +568,38 @@ class TestValidateAndExecuteMove:
         )
         assert updated_ship.hex_tile_id == hex_b.id
 
-    async def test_move_empty_path_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        ship = await _make_ship(db_session, game.id, player.id, hex_a.id)
-
-        with pytest.raises(ValueError, match="at least one destination"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=player.id,
-                ship_id=ship.id,
-                path_hex_ids=[],
-            )
-
-    async def test_move_nonexistent_ship_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        with pytest.raises(ValueError, match="not found"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=player.id,
-                ship_id=99999,
-                path_hex_ids=[1],
-            )
-
-    async def test_move_wrong_player_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        ship = await _make_ship(db_session, game.id, player.id, hex_a.id)
-
-        with pytest.raises(ValueError, match="do not own"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=99999,  # wrong player
-                ship_id=ship.id,
-                path_hex_ids=[hex_a.id],
-            )
-
-    async def test_move_starbase_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        starbase = await _make_ship(db_session, game.id, player.id, hex_a.id, ship_type="starbase")
-
-        with pytest.raises(ValueError, match="immobile"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=player.id,
-                ship_id=starbase.id,
-                path_hex_ids=[hex_a.id],
-            )
-
-    async def test_move_into_unexplored_hex_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        hex_b = await _make_unexplored_hex(db_session, game.id, 1, 0)
-        ship = await _make_ship(db_session, game.id, player.id, hex_a.id)
-
-        with pytest.raises(ValueError, match="unexplored"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=player.id,
-                ship_id=ship.id,
-                path_hex_ids=[hex_b.id],
-            )
-
-    async def test_move_no_wormhole_connection_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        # Adjacent hexes but no aligned wormholes
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[2, 3])
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[3])
-        ship = await _make_ship(db_session, game.id, player.id, hex_a.id)
-
-        with pytest.raises(ValueError, match="No wormhole connection"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=player.id,
-                ship_id=ship.id,
-                path_hex_ids=[hex_b.id],
-            )
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            pytest.param(lambda s: {"path_hex_ids": []}, _ERR_EMPTY, id="empty_path"),
+            pytest.param(lambda s: {"ship_id": 99999}, _ERR_NOT_FOUND, id="nonexistent_ship"),
+            pytest.param(lambda s: {"player_id": 99999}, _ERR_NOT_OWNED, id="wrong_player"),
+            pytest.param(lambda s: {"ship_id": s["starbase"].id}, _ERR_IMMOBILE, id="starbase"),
+            pytest.param(
+                lambda s: {"path_hex_ids": [s["unexplored"].id]}, _ERR_UNEXPLORED, id="unexplored_hex"
+            ),
+            # Adjacent hexes but no aligned wormholes
+            pytest.param(lambda s: {}, _ERR_NO_WORMHOLE, id="no_wormhole_connection"),
+            # 2 steps but range is 1 (no blueprint, falls back to 1)
+            pytest.param(
+                lambda s: {"path_hex_ids": [s["hex_b"].id, s["hex_c"].id]},
+                _ERR_RANGE,
+                id="path_exceeds_range",
+            ),
+        ],
+    )
+    async def test_invalid_move_raises(self, db_session: AsyncSession, move_scenario, overrides, match):
+        scenario = move_scenario
+        kwargs = {
+            "game_id": scenario["game"].id,
+            "player_id": scenario["player"].id,
+            "ship_id": scenario["ship"].id,
+            "path_hex_ids": [scenario["hex_b"].id],
+        }
+        kwargs.update(overrides(scenario))
 
-    async def test_move_path_exceeds_range_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        hex_a, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0, 3])
-        hex_b, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[0, 3])
-        hex_c, _ = await _make_explored_hex(db_session, game.id, 2, 0, wormholes=[0, 3])
-
-        # Default movement 1 (no blueprint, falls back to 1)
-        ship = await _make_ship(db_session, game.id, player.id, hex_a.id)
-
-        with pytest.raises(ValueError, match="movement range"):
-            await validate_and_execute_move(
-                db=db_session,
-                game_id=game.id,
-                player_id=player.id,
-                ship_id=ship.id,
-                path_hex_ids=[hex_b.id, hex_c.id],  # 2 steps but range is 1
-            )
+        with pytest.raises(ValueError, match=match):
+            await validate_and_execute_move(db=db_session, **kwargs)
 
 
 # ---------------------------------------------------------------------------
@@ -496,58 +607,65 @@ class TestValidateAndExecuteMove:
 # ---------------------------------------------------------------------------
 
 class TestInitializeDiscoveryDeck:
-    async def test_creates_one_tile_per_template(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
+    async def test_creates_one_tile_per_template(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
         tiles = await initialize_discovery_deck(db_session, game.id)
-        assert len(tiles) == len(DISCOVERY_TILE_TEMPLATES)
+        assert len(tiles) == NUM_DISCOVERY_TEMPLATES
 
-    async def test_all_tiles_undrawn_initially(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
+    async def test_all_tiles_undrawn_initially(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
         tiles = await initialize_discovery_deck(db_session, game.id)
         assert all(not t.is_drawn for t in tiles)
 
-    async def test_draw_orders_are_unique(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
+    async def test_draw_orders_are_unique(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
         tiles = await initialize_discovery_deck(db_session, game.id)
         orders = [t.draw_order for t in tiles]
         assert len(orders) == len(set(orders))
 
-    async def test_tiles_persisted_to_db(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
+    async def test_explicit_order_sets_draw_order(self, db_session: AsyncSession, sample_game: Game):
+        order = DISCOVERY_ORDER[::-1]
+        tiles = await initialize_discovery_deck(db_session, sample_game.id, order=order)
+        assert [t.discovery_template_id for t in sorted(tiles, key=lambda t: t.draw_order)] == order
+
+    async def test_tiles_persisted_to_db(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
         await initialize_discovery_deck(db_session, game.id)
 
-        result = await db_session.execute(
-            select(DiscoveryTile).where(DiscoveryTile.game_id == game.id)
+        tile_count = await db_session.scalar(
+            select(func.count())
+            .select_from(DiscoveryTile)
+            .where(DiscoveryTile.game_id == game.id)
         )
-        db_tiles = list(result.scalars().all())
-        assert len(db_tiles) == len(DISCOVERY_TILE_TEMPLATES)
+        assert tile_count == NUM_DISCOVERY_TEMPLATES
 
 
 # ---------------------------------------------------------------------------
 # draw_discovery_tile unit tests
 # ---------------------------------------------------------------------------
 
-class TestDrawDiscoveryTile:
-    async def test_draws_lowest_order_tile(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
+@pytest.fixture(scope="module")
+async def seeded_deck(module_db_session: AsyncSession):
+    """A game, its player and a discovery deck in DISCOVERY_ORDER, built once per module."""
+    game, player, _ = await _make_minimal_game_and_player(module_db_session)
+    tiles = await initialize_discovery_deck(module_db_session, game.id, order=DISCOVERY_ORDER)
+    await module_db_session.commit()
+    return game, player, tiles
 
-        # Find the tile with draw_order=0 to know which template should be drawn first
-        result = await db_session.execute(
-            select(DiscoveryTile)
-            .where(DiscoveryTile.game_id == game.id, DiscoveryTile.draw_order == 0)
-        )
-        first_tile = result.scalar_one()
+
+class TestDrawDiscoveryTile:
+    async def test_draws_lowest_order_tile(self, db_session: AsyncSession, seeded_deck):
+        game, player, tiles = seeded_deck
 
         drawn = await draw_discovery_tile(db_session, game.id, player.id, hex_tile_id=1)
         assert drawn is not None
-        assert drawn.id == first_tile.id
+        assert drawn.id == tiles[0].id
+        assert drawn.discovery_template_id == DISCOVERY_ORDER[0]
         assert drawn.is_drawn is True
         assert drawn.drawn_by_player_id == player.id
 
-    async def test_second_draw_returns_different_tile(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
+    async def test_second_draw_returns_different_tile(self, db_session: AsyncSession, seeded_deck):
+        game, player, _ = seeded_deck
 
         first = await draw_discovery_tile(db_session, game.id, player.id, hex_tile_id=1)
         second = await draw_discovery_tile(db_session, game.id, player.id, hex_tile_id=2)
@@ -555,14 +673,13 @@ class TestDrawDiscoveryTile:
         assert second is not None
         assert first.id != second.id
 
-    async def test_exhausted_deck_returns_none(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        tiles = await initialize_discovery_deck(db_session, game.id)
+    async def test_exhausted_deck_returns_none(self, db_session: AsyncSession, seeded_deck):
+        game, player, _ = seeded_deck
 
-        # Mark all as drawn
-        for tile in tiles:
-            tile.is_drawn = True
-        await db_session.flush()
+        # Mark all as drawn (through this test's session, so it is rolled back)
+        await db_session.execute(
+            update(DiscoveryTile).where(DiscoveryTile.game_id == game.id).values(is_drawn=True)
+        )
 
         drawn = await draw_discovery_tile(db_session, game.id, player.id, hex_tile_id=1)
         assert drawn is None
@@ -574,53 +691,51 @@ class TestDrawDiscoveryTile:
 
 class TestApplyDiscoveryEffect:
     async def _setup_game_player_resources(self, db: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db)
-        await initialize_discovery_deck(db, game.id)
-        return game, player
+        game, player, resources = await _make_minimal_game_and_player(db)
+        await initialize_discovery_deck(db, game.id, order=DISCOVERY_ORDER)
+        return game, player, resources
+
+    async def _make_drawn_tile(
+        self, db: AsyncSession, game_id: int, player_id: int, template_id: str, **kwargs
+    ) -> DiscoveryTile:
+        """A discovery tile already drawn by player_id, outside the seeded deck order."""
+        disc_tile = DiscoveryTile(
+            game_id=game_id,
+            discovery_template_id=template_id,
+            draw_order=99,
+            is_drawn=True,
+            drawn_by_player_id=player_id,
+            **kwargs,
+        )
+        db.add(disc_tile)
+        await db.flush()
+        return disc_tile
 
     async def test_money_effect_adds_money(self, db_session: AsyncSession):
-        game, player = await self._setup_game_player_resources(db_session)
-        resources = await db_session.execute(
-            select(PlayerResources).where(PlayerResources.player_id == player.id)
-        )
-        res = resources.scalar_one()
+        game, player, res = await self._setup_game_player_resources(db_session)
         before = res.money
 
-        disc_tile = DiscoveryTile(
-            game_id=game.id,
-            discovery_template_id="disc_money_3",
-            draw_order=99,
-            is_drawn=True,
-            drawn_by_player_id=player.id,
+        disc_tile = await self._make_drawn_tile(
+            db_session, game.id, player.id, "disc_money_3"
         )
-        db_session.add(disc_tile)
-        await db_session.flush()
 
         summary = await apply_discovery_effect(db_session, player.id, disc_tile, game.id)
         assert summary["effect_type"] == "money"
-        await db_session.refresh(res)
         assert res.money == before + 3
 
     async def test_orbital_effect_awards_vp(self, db_session: AsyncSession):
-        game, player = await self._setup_game_player_resources(db_session)
+        game, player, _ = await self._setup_game_player_resources(db_session)
         before_vp = player.vp_count
 
-        disc_tile = DiscoveryTile(
-            game_id=game.id,
-            discovery_template_id="disc_orbital_1",
-            draw_order=99,
-            is_drawn=True,
-            drawn_by_player_id=player.id,
+        disc_tile = await self._make_drawn_tile(
+            db_session, game.id, player.id, "disc_orbital_1"
         )
-        db_session.add(disc_tile)
-        await db_session.flush()
 
         await apply_discovery_effect(db_session, player.id, disc_tile, game.id)
-        await db_session.refresh(player)
         assert player.vp_count == before_vp + 1
 
     async def test_ancient_cruiser_effect_places_ship(self, db_session: AsyncSession):
-        game, player = await self._setup_game_player_resources(db_session)
+        game, player, _ = await self._setup_game_player_resources(db_session)
 
         # Create a hex tile to place the cruiser on
         hex_tile = HexTile(
@@ -632,16 +747,9 @@ class TestApplyDiscoveryEffect:
         db_session.add(hex_tile)
         await db_session.flush()
 
-        disc_tile = DiscoveryTile(
-            game_id=game.id,
-            discovery_template_id="disc_ancient_1",
-            draw_order=99,
-            is_drawn=True,
-            drawn_by_player_id=player.id,
-            hex_tile_id=hex_tile.id,
+        disc_tile = await self._make_drawn_tile(
+            db_session, game.id, player.id, "disc_ancient_1", hex_tile_id=hex_tile.id
         )
-        db_session.add(disc_tile)
-        await db_session.flush()
 
         summary = await apply_discovery_effect(db_session, player.id, disc_tile, game.id)
         assert summary.get("ship_placed") is True
@@ -653,7 +761,7 @@ class TestApplyDiscoveryEffect:
                 Ship.hex_tile_id == hex_tile.id,
             )
         )
-        ships = list(ships_result.scalars().all())
+        ships = ships_result.scalars().all()
         assert len(ships) == 1
         assert ships[0].ship_type == "cruiser"
         assert ships[0].is_ancient is False
@@ -665,53 +773,19 @@ class TestApplyDiscoveryEffect:
 
 class TestExecuteExplore:
     async def test_explore_reveals_unexplored_hex(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
-
-        # Source: explored, wormhole East (dir 0)
-        source, _ = await _make_explored_hex(
-            db_session, game.id, 0, 0, wormholes=[0], owner_player_id=player.id
-        )
-        # Target: unexplored, template with wormhole West (dir 3), at (1,0)
-        # Use a template that has wormhole in direction 3
-        # We'll directly set tile_template_id to None and set rotation manually
-        target = HexTile(
-            game_id=game.id,
-            q=1, r=0,
-            tile_type=TileType.inner,
-            is_explored=False,
-            tile_template_id=None,
-            rotation=0,
-        )
-        db_session.add(target)
-        await db_session.flush()
-
-        # For the explore to work, we need wormhole connectivity.
-        # effective_wormholes_for_hex on unexplored tile with no template = empty set.
-        # So we need to check: are_hexes_wormhole_connected will return False for target
-        # with no template. Let's use a template that has wormhole dir 3.
-        # Actually, let's give target a tile_template_id that has wormhole 3.
-        # Looking at data, we need a tile from ALL_TILES with wormhole 3.
-        # For simplicity in unit tests, let's manually set up an explored target
-        # that the exploration service accepts.
-        # The explore service checks are_hexes_wormhole_connected which checks
-        # effective_wormholes_for_hex. For unexplored with template, it uses template+rotation.
-
-        # Let's use a different approach: give the target a tile_template_id from ALL_TILES
-        # that includes wormhole direction 3. Let's check what inner_001 has.
-        from app.data.system_tiles import ALL_TILES
-        # Find a tile with wormhole 3
-        tile_with_w3 = None
-        for tid, tmpl in ALL_TILES.items():
-            if 3 in tmpl.wormholes and tmpl.tile_category == "inner":
-                tile_with_w3 = (tid, tmpl)
-                break
+        game, player, _ = await _make_minimal_game_and_player(db_session)
+        await initialize_discovery_deck(db_session, game.id, order=DISCOVERY_ORDER)
 
+        # Source faces East (dir 0); the target's template faces back West (dir 3).
+        tile_with_w3 = INNER_TILES_BY_WORMHOLE_DIR.get(3, [None])[0]
         assert tile_with_w3 is not None, "No inner tile with wormhole 3 found in ALL_TILES"
-        target.tile_template_id = tile_with_w3[0]
-        await db_session.flush()
-
-        ship = await _make_ship(db_session, game.id, player.id, source.id)
+        _, target, ship = await _make_explore_scene(
+            db_session,
+            game.id,
+            player.id,
+            template_id=tile_with_w3[0],
+            source_owner_id=player.id,
+        )
 
         result = await execute_explore(
             db=db_session,
@@ -722,16 +796,16 @@ class TestExecuteExplore:
         )
 
         assert result["hex_revealed"] == target.id
-        await db_session.refresh(target)
         assert target.is_explored is True
         assert target.owner_player_id == player.id
 
     async def test_explore_already_explored_hex_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
+        await initialize_discovery_deck(db_session, game.id, order=DISCOVERY_ORDER)
 
-        source, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        target, _ = await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[3])
+        (source, _), (target, _) = await _make_explored_hexes(
+            db_session, game.id, [(0, 0, [0]), (1, 0, [3])]
+        )
         ship = await _make_ship(db_session, game.id, player.id, source.id)
 
         with pytest.raises(ValueError, match="already explored"):
@@ -744,12 +818,12 @@ class TestExecuteExplore:
             )
 
     async def test_explore_non_adjacent_hex_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
+        await initialize_discovery_deck(db_session, game.id, order=DISCOVERY_ORDER)
 
-        source, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0, 1, 2, 3, 4, 5])
-        target = await _make_unexplored_hex(db_session, game.id, 3, 3)  # not adjacent
-        ship = await _make_ship(db_session, game.id, player.id, source.id)
+        _, target, ship = await _make_explore_scene(
+            db_session, game.id, player.id, 3, 3, source_wormholes=[0, 1, 2, 3, 4, 5]
+        )  # (3,3) is not adjacent
 
         with pytest.raises(ValueError, match="not adjacent"):
             await execute_explore(
@@ -761,31 +835,19 @@ class TestExecuteExplore:
             )
 
     async def test_explore_no_influence_discs_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
+        game, player, res = await _make_minimal_game_and_player(db_session)
+        await initialize_discovery_deck(db_session, game.id, order=DISCOVERY_ORDER)
 
         # Exhaust all influence discs
-        res_result = await db_session.execute(
-            select(PlayerResources).where(PlayerResources.player_id == player.id)
-        )
-        res = res_result.scalar_one()
         res.influence_discs_used = res.influence_discs_total
         await db_session.flush()
 
-        source, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-
-        from app.data.system_tiles import ALL_TILES
-        tile_with_w3 = None
-        for tid, tmpl in ALL_TILES.items():
-            if 3 in tmpl.wormholes and tmpl.tile_category == "inner":
-                tile_with_w3 = (tid, tmpl)
-                break
+        tile_with_w3 = INNER_TILES_BY_WORMHOLE_DIR.get(3, [None])[0]
 
         assert tile_with_w3 is not None, "No inner tile with wormhole 3 found in ALL_TILES"
-        target = await _make_unexplored_hex(
-            db_session, game.id, 1, 0, template_id=tile_with_w3[0]
+        _, target, ship = await _make_explore_scene(
+            db_session, game.id, player.id, template_id=tile_with_w3[0]
         )
-        ship = await _make_ship(db_session, game.id, player.id, source.id)
 
         with pytest.raises(ValueError, match="influence discs"):
             await execute_explore(
@@ -797,27 +859,19 @@ class TestExecuteExplore:
             )
 
     async def test_explore_places_ancient_ships(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await initialize_discovery_deck(db_session, game.id)
-
-        source, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
+        game, player, _ = await _make_minimal_game_and_player(db_session)
+        await initialize_discovery_deck(db_session, game.id, order=DISCOVERY_ORDER)
 
         # Find a tile that has wormhole 3 so we can connect source (wormhole 0) to it
-        from app.data.system_tiles import ALL_TILES
-        tile_with_w3_ancient = None
-        for tid, tmpl in ALL_TILES.items():
-            if 3 in tmpl.wormholes and tmpl.ancient_ships_count > 0:
-                tile_with_w3_ancient = (tid, tmpl)
-                break
+        tile_with_w3_ancient = ANCIENT_TILES_BY_WORMHOLE_DIR.get(3, [None])[0]
 
         if tile_with_w3_ancient is None:
             # Fallback: use any tile with w3, then directly test ancient placement
             pytest.skip("No tile with wormhole 3 and ancient ships in test data")
 
-        target = await _make_unexplored_hex(
-            db_session, game.id, 1, 0, template_id=tile_with_w3_ancient[0]
+        _, target, ship = await _make_explore_scene(
+            db_session, game.id, player.id, template_id=tile_with_w3_ancient[0]
         )
-        ship = await _make_ship(db_session, game.id, player.id, source.id)
 
         result = await execute_explore(
             db=db_session,
@@ -831,15 +885,16 @@ class TestExecuteExplore:
         assert result["ancient_ships_placed"] == expected_count
 
         # Verify ancient ships in DB
-        ships_result = await db_session.execute(
-            select(Ship).where(
+        ancient_count = await db_session.scalar(
+            select(func.count())
+            .select_from(Ship)
+            .where(
                 Ship.game_id == game.id,
                 Ship.hex_tile_id == target.id,
-                Ship.is_ancient == True,  # noqa: E712
+                Ship.is_ancient.is_(True),
             )
         )
-        ancient_ships = list(ships_result.scalars().all())
-        assert len(ancient_ships) == expected_count
+        assert ancient_count == expected_count
 
 
 # ---------------------------------------------------------------------------
@@ -848,7 +903,7 @@ class TestExecuteExplore:
 
 class TestExecuteInfluence:
     async def test_influence_claims_explored_unowned_hex(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
 
         hex_tile, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
         await _make_ship(db_session, game.id, player.id, hex_tile.id)
@@ -860,11 +915,10 @@ class TestExecuteInfluence:
             hex_tile_id=hex_tile.id,
         )
         assert result["owner_player_id"] == player.id
-        await db_session.refresh(hex_tile)
         assert hex_tile.owner_player_id == player.id
 
     async def test_influence_unexplored_hex_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
         hex_tile = await _make_unexplored_hex(db_session, game.id, 0, 0)
 
         with pytest.raises(ValueError, match="not been explored"):
@@ -876,7 +930,7 @@ class TestExecuteInfluence:
             )
 
     async def test_influence_already_owned_hex_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
         hex_tile, _ = await _make_explored_hex(
             db_session, game.id, 0, 0, wormholes=[0], owner_player_id=player.id
         )
@@ -891,7 +945,7 @@ class TestExecuteInfluence:
             )
 
     async def test_influence_no_ship_on_hex_raises(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
         hex_tile, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
         # No ship placed on hex_tile
 
@@ -909,41 +963,40 @@ class TestExecuteInfluence:
 # ---------------------------------------------------------------------------
 
 class TestGetFullMap:
-    async def test_returns_all_tiles(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
-        await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
-        await _make_explored_hex(db_session, game.id, 1, 0, wormholes=[3])
+    async def test_returns_all_tiles(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
+        await _make_explored_hexes(db_session, game.id, [(0, 0, [0]), (1, 0, [3])])
         await _make_unexplored_hex(db_session, game.id, 2, 0)
 
         map_data = await get_full_map(db_session, game.id)
         assert len(map_data) == 3
 
-    async def test_explored_tile_has_system_info(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+    async def test_explored_tile_has_system_info(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
         hex_tile, sys = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[0])
 
         map_data = await get_full_map(db_session, game.id)
-        tile_data = next(t for t in map_data if t["id"] == hex_tile.id)
+        tile_data = {t["id"]: t for t in map_data}[hex_tile.id]
         assert tile_data["is_explored"] is True
         assert tile_data["system"] is not None
         assert tile_data["system"]["name"] == "System (0,0)"
 
-    async def test_unexplored_tile_has_no_system(self, db_session: AsyncSession):
-        game, _ = await _make_minimal_game_and_player(db_session)
+    async def test_unexplored_tile_has_no_system(self, db_session: AsyncSession, sample_game: Game):
+        game = sample_game
         hex_tile = await _make_unexplored_hex(db_session, game.id, 0, 0)
 
         map_data = await get_full_map(db_session, game.id)
-        tile_data = next(t for t in map_data if t["id"] == hex_tile.id)
+        tile_data = {t["id"]: t for t in map_data}[hex_tile.id]
         assert tile_data["is_explored"] is False
         assert tile_data["system"] is None
 
     async def test_ships_included_in_tile_data(self, db_session: AsyncSession):
-        game, player = await _make_minimal_game_and_player(db_session)
+        game, player, _ = await _make_minimal_game_and_player(db_session)
         hex_tile, _ = await _make_explored_hex(db_session, game.id, 0, 0, wormholes=[])
         ship = await _make_ship(db_session, game.id, player.id, hex_tile.id)
 
         map_data = await get_full_map(db_session, game.id)
-        tile_data = next(t for t in map_data if t["id"] == hex_tile.id)
+        tile_data = {t["id"]: t for t in map_data}[hex_tile.id]
         assert len(tile_data["ships"]) == 1
         assert tile_data["ships"][0]["id"] == ship.id
 
@@ -953,15 +1006,15 @@ class TestGetFullMap:
 # ---------------------------------------------------------------------------
 
 class TestMapEndpoint:
-    async def test_map_requires_auth(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_map_requires_auth(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(f"/games/{game_id}/map")
         assert resp.status_code == 401
 
-    async def test_map_returns_tiles_after_game_start(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_map_returns_tiles_after_game_start(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -972,8 +1025,8 @@ class TestMapEndpoint:
         assert isinstance(tiles, list)
         assert len(tiles) > 0
 
-    async def test_map_tiles_have_required_fields(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_map_tiles_have_required_fields(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -981,17 +1034,11 @@ class TestMapEndpoint:
         )
         assert resp.status_code == 200
         for tile in resp.json():
-            assert "id" in tile
-            assert "q" in tile
-            assert "r" in tile
-            assert "tile_type" in tile
-            assert "is_explored" in tile
-            assert "owner_player_id" in tile
-            assert "system" in tile
-            assert "ships" in tile
-
-    async def test_map_404_unknown_game(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+            missing = MAP_TILE_FIELDS - tile.keys()
+            assert not missing, f"tile {tile.get('id')} missing {sorted(missing)}"
+
+    async def test_map_404_unknown_game(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         resp = await db_client.get(
             "/games/99999/map", headers=auth_headers(tokens[0])
         )
@@ -1013,10 +1060,9 @@ class TestMapEndpoint:
         )
         assert resp.status_code == 400
 
-    async def test_map_includes_homeworld_tiles(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+    async def test_map_includes_homeworld_tiles(self, db_client: AsyncClient, started_game_2p):
+        # The shared game seats human and planta, the first two of SPECIES_CYCLE.
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -1027,8 +1073,8 @@ class TestMapEndpoint:
         tile_types = {t["tile_type"] for t in tiles}
         assert "homeworld" in tile_types
 
-    async def test_map_has_galactic_center(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_map_has_galactic_center(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -1038,9 +1084,9 @@ class TestMapEndpoint:
         gc_tiles = [t for t in tiles if t["tile_type"] == "galactic_center"]
         assert len(gc_tiles) == 1
 
-    async def test_map_discovery_deck_initialized_on_game_start(self, db_client: AsyncClient):
+    async def test_map_discovery_deck_initialized_on_game_start(self, db_client: AsyncClient, started_game_2p):
         """Discovery deck should have 18 tiles after game start."""
-        tokens, game = await setup_started_game(db_client, num_players=2)
+        tokens, game = started_game_2p
         # This is verifiable indirectly: game started without error means
         # initialize_discovery_deck ran. We verify map returns tiles.
         game_id = game["id"]
@@ -1055,8 +1101,8 @@ class TestMapEndpoint:
 # ---------------------------------------------------------------------------
 
 class TestMoveActionAPI:
-    async def test_move_invalid_payload_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_move_invalid_payload_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         # Missing ship_id and path
@@ -1068,8 +1114,8 @@ class TestMoveActionAPI:
         assert resp.status_code == 400
         assert "ship_id" in resp.json()["detail"].lower() or "path" in resp.json()["detail"].lower()
 
-    async def test_move_nonexistent_ship_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_move_nonexistent_ship_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.post(
@@ -1088,8 +1134,8 @@ class TestMoveActionAPI:
 # ---------------------------------------------------------------------------
 
 class TestExploreActionAPI:
-    async def test_explore_invalid_payload_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_explore_invalid_payload_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         # Missing required fields
@@ -1100,8 +1146,8 @@ class TestExploreActionAPI:
         )
         assert resp.status_code == 400
 
-    async def test_explore_nonexistent_ship_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_explore_nonexistent_ship_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.post(
@@ -1120,8 +1166,8 @@ class TestExploreActionAPI:
 # ---------------------------------------------------------------------------
 
 class TestInfluenceActionAPI:
-    async def test_influence_invalid_payload_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_influence_invalid_payload_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.post(
@@ -1132,8 +1178,8 @@ class TestInfluenceActionAPI:
         assert resp.status_code == 400
         assert "hex_tile_id" in resp.json()["detail"].lower()
 
-    async def test_influence_nonexistent_hex_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_influence_nonexistent_hex_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.post(
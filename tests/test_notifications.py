@@ -1,9 +1,18 @@
 """Tests for email notifications and the GET /games/{id}/status endpoint."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import patch
 
+import pytest
 from httpx import AsyncClient
 
+from app.models.game import Game, GamePhase, GameStatus
+from app.models.player import Player, Species
+from app.models.user import User
+from app.services.notification_service import drain_pending_sends, notify_game_ended
+
+from tests.helpers import auth_headers
+
 
 # ---- helpers -----------------------------------------------------------------
 
@@ -21,22 +30,19 @@ async def register_and_login(
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
+# One distinct species per seat, in seat order.
+_SPECIES = ("human", "planta", "mechanema", "orion_hegemony")
 
 
 async def setup_started_game(
-    client: AsyncClient, num_players: int = 2
+    client: AsyncClient, users: tuple[list[str], list[str]], num_players: int = 2
 ) -> tuple[list[str], list[str], dict]:
-    """Create + start a game; return (tokens, emails, game_dict)."""
-    tokens: list[str] = []
-    emails = [f"notif{i}@example.com" for i in range(num_players)]
-    usernames = [f"notifuser{i}" for i in range(num_players)]
-    species = ["human", "planta", "mechanema", "orion_hegemony"]
+    """Create + start a game; return (tokens, emails, game_dict).
 
-    for i in range(num_players):
-        token = await register_and_login(client, emails[i], usernames[i])
-        tokens.append(token)
+    Seats the first num_players of the pre-registered (tokens, emails) users.
+    """
+    tokens = users[0][:num_players]
+    emails = users[1][:num_players]
 
     create_resp = await client.post(
         "/games",
@@ -64,7 +70,7 @@ async def setup_started_game(
     for i in range(num_players):
         resp = await client.post(
             f"/games/{game_id}/select-species",
-            json={"species": species[i]},
+            json={"species": _SPECIES[i]},
             headers=auth_headers(tokens[i]),
         )
         assert resp.status_code == 200
@@ -76,11 +82,34 @@ async def setup_started_game(
     return tokens, emails, start_resp.json()
 
 
+@pytest.fixture(scope="module")
+async def notif_users(module_db_client: AsyncClient) -> tuple[list[str], list[str]]:
+    """Four users registered once per module; returns (tokens, emails).
+
+    Registration hashes a password, so the tests seat these users in their
+    own games instead of registering new ones each time.
+    """
+    emails = [f"notif{i}@example.com" for i in range(4)]
+    tokens = [
+        await register_and_login(module_db_client, email, f"notifuser{i}")
+        for i, email in enumerate(emails)
+    ]
+    return tokens, emails
+
+
+@pytest.fixture(scope="module")
+async def started_game_2p(
+    module_db_client: AsyncClient, notif_users: tuple[list[str], list[str]]
+) -> tuple[list[str], list[str], dict]:
+    """A started 2-player game shared by the read-only status endpoint tests."""
+    return await setup_started_game(module_db_client, notif_users, num_players=2)
+
+
 # ---- game status endpoint ----------------------------------------------------
 
 class TestGameStatusEndpoint:
-    async def test_status_returns_correct_fields(self, db_client: AsyncClient):
-        tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_status_returns_correct_fields(self, db_client: AsyncClient, started_game_2p):
+        tokens, emails, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -96,8 +125,8 @@ class TestGameStatusEndpoint:
         assert data["current_phase"] == "activation"
         assert data["active_player_id"] is not None
 
-    async def test_status_active_player_matches_game_state(self, db_client: AsyncClient):
-        tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_status_active_player_matches_game_state(self, db_client: AsyncClient, started_game_2p):
+        tokens, emails, game = started_game_2p
         game_id = game["id"]
 
         status_resp = await db_client.get(
@@ -114,15 +143,15 @@ class TestGameStatusEndpoint:
         assert len(active_players) == 1
         assert status_data["active_player_id"] == active_players[0]["id"]
 
-    async def test_status_404_for_unknown_game(self, db_client: AsyncClient):
-        tokens, _, _ = await setup_started_game(db_client, num_players=2)
+    async def test_status_404_for_unknown_game(self, db_client: AsyncClient, started_game_2p):
+        tokens, _, _ = started_game_2p
         resp = await db_client.get(
             "/games/99999/status", headers=auth_headers(tokens[0])
         )
         assert resp.status_code == 404
 
-    async def test_status_requires_auth(self, db_client: AsyncClient):
-        tokens, _, game = await setup_started_game(db_client, num_players=2)
+    async def test_status_requires_auth(self, db_client: AsyncClient, started_game_2p):
+        tokens, _, game = started_game_2p
         resp = await db_client.get(f"/games/{game['id']}/status")
         assert resp.status_code == 401
 
@@ -130,84 +159,67 @@ class TestGameStatusEndpoint:
 # ---- notify_game_started -----------------------------------------------------
 
 class TestNotifyGameStarted:
-    async def test_send_email_called_for_each_player_on_start(self, db_client: AsyncClient):
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_send_email_called_for_each_player_on_start(self, db_client: AsyncClient, notif_users, mock_send_email):
+        tokens, emails, game = await setup_started_game(db_client, notif_users, num_players=2)
 
         # One email per player (2-player game)
-        assert mock_send.call_count == 2
-        called_tos = [c.args[0] for c in mock_send.call_args_list]
+        assert mock_send_email.call_count == 2
+        called_tos = [c.args[0] for c in mock_send_email.call_args_list]
         for email in emails:
             assert email in called_tos
 
-    async def test_game_start_email_contains_game_link(self, db_client: AsyncClient):
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_game_start_email_contains_game_link(self, db_client: AsyncClient, notif_users, mock_send_email):
+        tokens, emails, game = await setup_started_game(db_client, notif_users, num_players=2)
 
         # Check that at least one call's body contains the game link
         game_id = game["id"]
-        bodies = [c.args[2] for c in mock_send.call_args_list]
-        assert any(f"/games/{game_id}" in body for body in bodies)
+        all_bodies = "\n".join(c.args[2] for c in mock_send_email.call_args_list)
+        assert f"/games/{game_id}" in all_bodies
 
-    async def test_game_start_email_mentions_game_name(self, db_client: AsyncClient):
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_game_start_email_mentions_game_name(self, db_client: AsyncClient, notif_users, mock_send_email):
+        tokens, emails, game = await setup_started_game(db_client, notif_users, num_players=2)
 
-        subjects = [c.args[1] for c in mock_send.call_args_list]
-        assert any("Notif Test Game" in s for s in subjects)
+        all_subjects = "\n".join(c.args[1] for c in mock_send_email.call_args_list)
+        assert "Notif Test Game" in all_subjects
 
 
 # ---- notify_turn_change ------------------------------------------------------
 
 class TestNotifyTurnChange:
-    async def test_send_email_called_on_turn_change(self, db_client: AsyncClient):
-        tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_send_email_called_on_turn_change(self, db_client: AsyncClient, notif_users, mock_send_email):
+        tokens, emails, game = await setup_started_game(db_client, notif_users, num_players=2)
         game_id = game["id"]
+        mock_send_email.reset_mock()  # drop the game-start emails
 
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            # First player submits PASS action → turn moves to second player
-            resp = await db_client.post(
-                f"/games/{game_id}/action",
-                json={"action_type": "pass"},
-                headers=auth_headers(tokens[0]),
-            )
-            assert resp.status_code == 201
+        # First player submits PASS action → turn moves to second player
+        resp = await db_client.post(
+            f"/games/{game_id}/action",
+            json={"action_type": "pass"},
+            headers=auth_headers(tokens[0]),
+        )
+        assert resp.status_code == 201
 
         # Exactly one email should be sent to the next player
-        assert mock_send.call_count == 1
+        assert mock_send_email.call_count == 1
 
-    async def test_turn_change_email_contains_game_link(self, db_client: AsyncClient):
-        tokens, emails, game = await setup_started_game(db_client, num_players=2)
+    async def test_turn_change_email_contains_game_link(self, db_client: AsyncClient, notif_users, mock_send_email):
+        tokens, emails, game = await setup_started_game(db_client, notif_users, num_players=2)
         game_id = game["id"]
+        mock_send_email.reset_mock()  # drop the game-start emails
 
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            await db_client.post(
-                f"/games/{game_id}/action",
-                json={"action_type": "pass"},
-                headers=auth_headers(tokens[0]),
-            )
-
-        bodies = [c.args[2] for c in mock_send.call_args_list]
-        assert any(f"/games/{game_id}" in body for body in bodies)
-
-    async def test_turn_change_email_recipient_is_next_player(self, db_client: AsyncClient):
-        tokens, emails, game = await setup_started_game(db_client, num_players=2)
+        await db_client.post(
+            f"/games/{game_id}/action",
+            json={"action_type": "pass"},
+            headers=auth_headers(tokens[0]),
+        )
+
+        all_bodies = "\n".join(c.args[2] for c in mock_send_email.call_args_list)
+        assert f"/games/{game_id}" in all_bodies
+
+    async def test_turn_change_email_recipient_is_next_player(self, db_client: AsyncClient, notif_users, mock_send_email):
+        tokens, emails, game = await setup_started_game(db_client, notif_users, num_players=2)
         game_id = game["id"]
+        mock_send_email.reset_mock()  # drop the game-start emails
 
         # Determine which player is active (player 0 or player 1)
         status_resp = await db_client.get(
@@ -222,30 +234,21 @@ class TestNotifyTurnChange:
         inactive_idx = 1 - active_idx  # with 2 players
         next_email = emails[inactive_idx]
 
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            await db_client.post(
-                f"/games/{game_id}/action",
-                json={"action_type": "pass"},
-                headers=auth_headers(tokens[active_idx]),
-            )
-
-        called_tos = [c.args[0] for c in mock_send.call_args_list]
+        await db_client.post(
+            f"/games/{game_id}/action",
+            json={"action_type": "pass"},
+            headers=auth_headers(tokens[active_idx]),
+        )
+
+        called_tos = [c.args[0] for c in mock_send_email.call_args_list]
         assert next_email in called_tos
 
 
 # ---- notify_game_ended (unit test of the service function) ------------------
 
 class TestNotifyGameEnded:
-    async def test_notify_game_ended_sends_to_all_players(self, db_session):
+    async def test_notify_game_ended_sends_to_all_players(self, db_session, mock_send_email):
         """Unit test: call notify_game_ended directly and verify send_email calls."""
-        from app.models.game import Game, GamePhase, GameStatus
-        from app.models.player import Player, Species
-        from app.models.user import User
-        from app.services.notification_service import notify_game_ended
-
         # Create minimal user + game + player records in the test DB
         user1 = User(email="end1@example.com", username="enduser1", hashed_password="x")
         user2 = User(email="end2@example.com", username="enduser2", hashed_password="x")
@@ -268,23 +271,15 @@ class TestNotifyGameEnded:
         db_session.add_all([p1, p2])
         await db_session.flush()
 
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            await notify_game_ended(db_session, game, [p1, p2], winner=p1)
+        await notify_game_ended(db_session, game, [p1, p2], winner=p1)
+        await db_session.commit()
 
-        assert mock_send.call_count == 2
-        called_tos = {c.args[0] for c in mock_send.call_args_list}
+        assert mock_send_email.call_count == 2
+        called_tos = {c.args[0] for c in mock_send_email.call_args_list}
         assert "end1@example.com" in called_tos
         assert "end2@example.com" in called_tos
 
-    async def test_notify_game_ended_email_mentions_winner(self, db_session):
-        from app.models.game import Game, GamePhase, GameStatus
-        from app.models.player import Player, Species
-        from app.models.user import User
-        from app.services.notification_service import notify_game_ended
-
+    async def test_notify_game_ended_email_mentions_winner(self, db_session, mock_send_email):
         user = User(email="winner@example.com", username="winneruser", hashed_password="x")
         db_session.add(user)
         await db_session.flush()
@@ -304,15 +299,56 @@ class TestNotifyGameEnded:
         db_session.add(p)
         await db_session.flush()
 
-        with patch(
-            "app.services.notification_service.send_email",
-            new_callable=AsyncMock,
-        ) as mock_send:
-            await notify_game_ended(db_session, game, [p], winner=p)
+        await notify_game_ended(db_session, game, [p], winner=p)
+        await db_session.commit()
 
-        bodies = [c.args[2] for c in mock_send.call_args_list]
+        bodies = [c.args[2] for c in mock_send_email.call_args_list]
         assert any("winner@example.com" in body or "20 VP" in body for body in bodies)
 
+    async def test_notify_game_ended_does_not_wait_for_smtp(self, db_session, mock_send_email):
+        """The sends run in the background, so a stalled mail server never blocks the caller."""
+        user = User(email="slow@example.com", username="slowuser", hashed_password="x")
+        db_session.add(user)
+        await db_session.flush()
+        game = Game(name="Slow Mail Game", status=GameStatus.finished, host_user_id=user.id)
+        db_session.add(game)
+        await db_session.flush()
+        p = Player(game_id=game.id, user_id=user.id, turn_order=0, vp_count=3)
+        db_session.add(p)
+        await db_session.flush()
+
+        smtp_released = asyncio.Event()
+
+        async def stalled_send(*args):
+            await smtp_released.wait()
+
+        mock_send_email.side_effect = stalled_send
+        await asyncio.wait_for(notify_game_ended(db_session, game, [p]), timeout=1)
+        await asyncio.wait_for(db_session.commit(), timeout=1)
+        assert mock_send_email.call_count == 1
+
+        smtp_released.set()
+        await drain_pending_sends()
+
+    async def test_notify_game_ended_waits_for_commit(self, db_session, mock_send_email):
+        """Nothing is sent before the commit, and a rollback drops the queued emails."""
+        user = User(email="rolled@example.com", username="rolleduser", hashed_password="x")
+        db_session.add(user)
+        await db_session.flush()
+        game = Game(name="Rolled Back Game", status=GameStatus.finished, host_user_id=user.id)
+        db_session.add(game)
+        await db_session.flush()
+        p = Player(game_id=game.id, user_id=user.id, turn_order=0, vp_count=3)
+        db_session.add(p)
+        await db_session.flush()
+
+        await notify_game_ended(db_session, game, [p])
+        assert mock_send_email.call_count == 0
+
+        await db_session.rollback()
+        await db_session.commit()
+        assert mock_send_email.call_count == 0
+
 
 # ---- send_email (unit test of the sender) ------------------------------------
 
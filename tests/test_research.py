@@ -13,8 +13,12 @@ Covers:
 - Insufficient science rejection
 """
 
+from collections.abc import Sequence
+from dataclasses import FrozenInstanceError
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.data.technologies import (
@@ -27,11 +31,18 @@ from app.data.technologies import (
 from app.services.research_service import (
     apply_research,
     calculate_effective_cost,
-    count_techs_in_category,
+    count_techs_by_category,
     get_player_tech_ids,
     grant_technology,
     validate_research,
 )
+from app.models.game import Game, GamePhase, GameStatus
+from app.models.player import Player, Species
+from app.models.player_resources import PlayerResources
+from app.models.player_technology import PlayerTechnology
+from app.models.user import User
+
+from tests.helpers import auth_headers
 
 
 # ---------------------------------------------------------------------------
@@ -49,30 +60,106 @@ async def register_and_login(
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
+@pytest.fixture(scope="module")
+async def module_player_id(db_connection) -> int:
+    """ID of a human player with resources in their own active game.
+
+    Inserted once per module and handed to every test that needs a player.
+    Whatever a test does to that player is rolled back with its SAVEPOINT
+    (see db_session), so each test starts from the same state.
+    """
+    user_id = (
+        await db_connection.execute(
+            insert(User).returning(User.id),
+            {"email": "rsch_player@example.com", "username": "rsch_player", "hashed_password": "x"},
+        )
+    ).scalar_one()
+    game_id = (
+        await db_connection.execute(
+            insert(Game).returning(Game.id),
+            {
+                "name": "rsch-player",
+                "status": GameStatus.active,
+                "max_players": 2,
+                "current_round": 1,
+                "current_phase": GamePhase.activation,
+                "host_user_id": user_id,
+            },
+        )
+    ).scalar_one()
+    player_id = (
+        await db_connection.execute(
+            insert(Player).returning(Player.id),
+            {"game_id": game_id, "user_id": user_id, "species": Species.human, "turn_order": 0},
+        )
+    ).scalar_one()
+    await db_connection.execute(
+        insert(PlayerResources),
+        {"player_id": player_id, "money": 10, "science": 20, "materials": 10},
+    )
+    return player_id
+
 
+async def _load_module_player(
+    db: AsyncSession, player_id: int, science: int = 20
+) -> tuple[Player, PlayerResources]:
+    """Load the shared module player through `db` and set their science.
+
+    Every test gets the same rows, not fresh ones; the science change and
+    anything else the test does is rolled back with its SAVEPOINT.
+    """
+    player = await db.get(Player, player_id)
+    resources = await db.scalar(
+        select(PlayerResources).where(PlayerResources.player_id == player_id)
+    )
+    resources.science = science
+    return player, resources
 
-SPECIES_CYCLE = [
+
+async def _grant_techs(db: AsyncSession, player_id: int, *tech_ids: str) -> None:
+    """Give the player techs in round 1 with one multi-row INSERT.
+
+    Unlike grant_technology this skips the ownership check and immediate
+    effects, so only use it to set up prerequisites and category discounts.
+    """
+    await db.execute(
+        insert(PlayerTechnology),
+        [{"player_id": player_id, "tech_id": tech_id, "acquired_round": 1} for tech_id in tech_ids],
+    )
+
+
+def _research_action(tech_id: str) -> dict:
+    """Body for POST /games/{id}/action that researches `tech_id`."""
+    return {"action_type": "research", "payload": {"tech_id": tech_id}}
+
+
+SPECIES_CYCLE = (
     "human",
     "planta",
     "mechanema",
     "orion_hegemony",
     "eridani_empire",
     "hydran_progress",
-]
+)
 
 
 async def setup_started_game(
-    client: AsyncClient, num_players: int = 2, species_list: list[str] | None = None
+    client: AsyncClient,
+    num_players: int = 2,
+    species_list: Sequence[str] | None = None,
+    tag: str = "rsch",
 ) -> tuple[list[str], dict]:
-    """Create, populate, and start a game. Returns (tokens, game_dict)."""
+    """Create, populate, and start a game. Returns (tokens, game_dict).
+
+    `tag` prefixes the players' emails and usernames so that several games can
+    be set up in one module.
+    """
     if species_list is None:
         species_list = SPECIES_CYCLE[:num_players]
 
     tokens = []
-    emails = [f"rsch_p{i}@example.com" for i in range(num_players)]
-    usernames = [f"rsch_player{i}" for i in range(num_players)]
+    emails = [f"{tag}_p{i}@example.com" for i in range(num_players)]
+    usernames = [f"{tag}_player{i}" for i in range(num_players)]
 
     for i in range(num_players):
         token = await register_and_login(client, emails[i], usernames[i])
@@ -113,47 +200,59 @@ async def setup_started_game(
     return tokens, start_resp.json()
 
 
+# Started games shared by every API test in the module. What a test does to
+# them through db_client is rolled back with its SAVEPOINT (see db_session).
+
+@pytest.fixture(scope="module")
+async def started_game_2p(module_db_client: AsyncClient) -> tuple[list[str], dict]:
+    """Human host, Planta guest."""
+    return await setup_started_game(module_db_client, num_players=2)
+
+
+@pytest.fixture(scope="module")
+async def started_game_planta_human(module_db_client: AsyncClient) -> tuple[list[str], dict]:
+    """Planta host, Human guest."""
+    return await setup_started_game(
+        module_db_client, num_players=2, species_list=["planta", "human"], tag="rsch_ph"
+    )
+
+
+@pytest.fixture(scope="module")
+async def started_game_hydran_planta(module_db_client: AsyncClient) -> tuple[list[str], dict]:
+    """Hydran Progress host, Planta guest."""
+    return await setup_started_game(
+        module_db_client, num_players=2, species_list=["hydran_progress", "planta"], tag="rsch_hp"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Technology data definitions
 # ---------------------------------------------------------------------------
 
+# A few techs that must be defined in each researchable category.
+_EXPECTED_TECHS_BY_CATEGORY = {
+    TechCategory.military: {"improved_hull", "gauss_shield", "neural_targeting"},
+    TechCategory.grid: {"nuclear_drive", "fusion_drive", "nuclear_source"},
+    TechCategory.nano: {"advanced_mining", "quantum_grid"},
+    TechCategory.quantum: {"ion_cannon", "flux_missile"},
+    TechCategory.rare: {"cloaking_device", "point_defense"},
+}
+
+
 class TestTechnologyDefinitions:
     def test_all_six_categories_populated(self):
         for cat in TechCategory:
             techs = list_technologies_by_category(cat)
             assert len(techs) >= 1, f"Category {cat.value} has no technologies"
 
-    def test_military_techs_exist(self):
-        mil = list_technologies_by_category(TechCategory.military)
-        ids = {t.tech_id for t in mil}
-        assert "improved_hull" in ids
-        assert "gauss_shield" in ids
-        assert "neural_targeting" in ids
-
-    def test_grid_techs_exist(self):
-        grid = list_technologies_by_category(TechCategory.grid)
-        ids = {t.tech_id for t in grid}
-        assert "nuclear_drive" in ids
-        assert "fusion_drive" in ids
-        assert "nuclear_source" in ids
-
-    def test_nano_techs_exist(self):
-        nano = list_technologies_by_category(TechCategory.nano)
-        ids = {t.tech_id for t in nano}
-        assert "advanced_mining" in ids
-        assert "quantum_grid" in ids
-
-    def test_quantum_techs_exist(self):
-        q = list_technologies_by_category(TechCategory.quantum)
-        ids = {t.tech_id for t in q}
-        assert "ion_cannon" in ids
-        assert "flux_missile" in ids
-
-    def test_rare_techs_exist(self):
-        rare = list_technologies_by_category(TechCategory.rare)
-        ids = {t.tech_id for t in rare}
-        assert "cloaking_device" in ids
-        assert "point_defense" in ids
+    @pytest.mark.parametrize(
+        ("category", "expected_ids"),
+        _EXPECTED_TECHS_BY_CATEGORY.items(),
+        ids=[category.value for category in _EXPECTED_TECHS_BY_CATEGORY],
+    )
+    def test_category_contains_expected_techs(self, category, expected_ids):
+        ids = {t.tech_id for t in list_technologies_by_category(category)}
+        assert expected_ids <= ids, f"missing from {category.value}: {expected_ids - ids}"
 
     def test_ancient_techs_exist(self):
         anc = list_technologies_by_category(TechCategory.ancient)
@@ -165,9 +264,14 @@ class TestTechnologyDefinitions:
             assert not t.can_research, f"{t.name} should have can_research=False"
 
     def test_researchable_list_excludes_ancient(self):
-        researchable = list_researchable_technologies()
-        for t in researchable:
-            assert t.category != TechCategory.ancient
+        categories = {t.category for t in list_researchable_technologies()}
+        assert TechCategory.ancient not in categories
+
+    def test_category_lists_partition_all_techs(self):
+        by_category = [t for cat in TechCategory for t in list_technologies_by_category(cat)]
+        assert sorted(t.tech_id for t in by_category) == sorted(
+            t.tech_id for t in list_technologies()
+        )
 
     def test_get_technology_by_id(self):
         tech = get_technology("ion_cannon")
@@ -175,6 +279,16 @@ class TestTechnologyDefinitions:
         assert tech.category == TechCategory.quantum
         assert tech.base_cost == 2
 
+    def test_definitions_are_immutable(self):
+        tech = get_technology("ion_cannon")
+        with pytest.raises(FrozenInstanceError):
+            tech.base_cost = 0
+        assert isinstance(tech.prerequisites, tuple)
+        assert isinstance(tech.effects, tuple)
+        with pytest.raises(TypeError):
+            tech.effects[0].params["amount"] = 99
+        assert hash(tech) == hash(get_technology("ion_cannon"))
+
     def test_get_technology_unknown_raises(self):
         with pytest.raises(KeyError):
             get_technology("nonexistent_tech_xyz")
@@ -219,81 +333,21 @@ class TestCostCalculation:
         assert calculate_effective_cost(tech, 3) == 6
         assert calculate_effective_cost(tech, 9) == 0
 
-    async def test_count_techs_in_category_empty(self, db_session: AsyncSession):
-        # Insert a player directly for unit test
-        from app.models.player import Player, Species
-        from app.models.game import Game, GameStatus, GamePhase
-        from app.models.user import User
-
-        user = User(email="costtest@example.com", username="costtest", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(
-            name="cost-test",
-            status=GameStatus.active,
-            max_players=2,
-            current_round=1,
-            current_phase=GamePhase.activation,
-            host_user_id=user.id,
-        )
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(
-            game_id=game.id,
-            user_id=user.id,
-            species=Species.human,
-            turn_order=0,
-        )
-        db_session.add(player)
-        await db_session.flush()
-
-        count = await count_techs_in_category(player.id, TechCategory.quantum, db_session)
-        assert count == 0
-
-    async def test_count_techs_in_category_after_grants(self, db_session: AsyncSession):
-        from app.models.player import Player, Species
-        from app.models.game import Game, GameStatus, GamePhase
-        from app.models.user import User
-        from app.models.player_resources import PlayerResources
-
-        user = User(email="catcount@example.com", username="catcount", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(
-            name="catcount-test",
-            status=GameStatus.active,
-            max_players=2,
-            current_round=1,
-            current_phase=GamePhase.activation,
-            host_user_id=user.id,
-        )
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(
-            game_id=game.id,
-            user_id=user.id,
-            species=Species.human,
-            turn_order=0,
-        )
-        db_session.add(player)
-        await db_session.flush()
+    def test_count_techs_by_category(self):
+        counts = count_techs_by_category({"ion_cannon", "flux_missile", "improved_hull", "no_such_tech"})
+        assert counts[TechCategory.quantum] == 2
+        assert counts[TechCategory.military] == 1
+        assert counts[TechCategory.grid] == 0
 
-        resources = PlayerResources(
-            player_id=player.id, money=10, science=10, materials=10
-        )
-        db_session.add(resources)
-        await db_session.flush()
+    async def test_count_techs_by_category_after_grants(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id, science=10)
 
         # Grant two quantum techs
         await grant_technology(player.id, "ion_cannon", 1, db_session)
         await grant_technology(player.id, "flux_missile", 1, db_session)
 
-        count = await count_techs_in_category(player.id, TechCategory.quantum, db_session)
-        assert count == 2
+        counts = count_techs_by_category(await get_player_tech_ids(player.id, db_session))
+        assert counts[TechCategory.quantum] == 2
 
 
 # ---------------------------------------------------------------------------
@@ -301,82 +355,40 @@ class TestCostCalculation:
 # ---------------------------------------------------------------------------
 
 class TestResearchValidation:
-    async def _make_player(self, db, email_suffix, science=20):
-        from app.models.player import Player, Species
-        from app.models.game import Game, GameStatus, GamePhase
-        from app.models.user import User
-        from app.models.player_resources import PlayerResources
-
-        user = User(
-            email=f"valtest_{email_suffix}@example.com",
-            username=f"valtest_{email_suffix}",
-            hashed_password="x",
-        )
-        db.add(user)
-        await db.flush()
-
-        game = Game(
-            name=f"val-test-{email_suffix}",
-            status=GameStatus.active,
-            max_players=2,
-            current_round=1,
-            current_phase=GamePhase.activation,
-            host_user_id=user.id,
-        )
-        db.add(game)
-        await db.flush()
-
-        player = Player(
-            game_id=game.id,
-            user_id=user.id,
-            species=Species.human,
-            turn_order=0,
-        )
-        db.add(player)
-        await db.flush()
-
-        resources = PlayerResources(
-            player_id=player.id, money=10, science=science, materials=10
-        )
-        db.add(resources)
-        await db.flush()
-
-        return player, resources
-
-    async def test_validate_research_success(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "vr01")
+    async def test_validate_research_success(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id)
         tech, cost = await validate_research(player.id, "ion_cannon", db_session)
         assert tech.tech_id == "ion_cannon"
         assert cost == 2  # base cost, 0 owned in category
 
-    async def test_cannot_research_ancient_tech(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "vr02")
+    async def test_cannot_research_ancient_tech(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id)
         with pytest.raises(ValueError, match="cannot be researched"):
             await validate_research(player.id, "monolith", db_session)
 
-    async def test_prerequisite_not_met(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "vr03")
+    async def test_prerequisite_not_met(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id)
         # plasma_cannon requires ion_cannon
         with pytest.raises(ValueError, match="prerequisite"):
             await validate_research(player.id, "plasma_cannon", db_session)
 
-    async def test_prerequisite_met_after_grant(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "vr04")
+    async def test_prerequisite_met_after_grant(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id)
         # Grant the prerequisite
-        await grant_technology(player.id, "ion_cannon", 1, db_session)
+        await _grant_techs(db_session, player.id, "ion_cannon")
         tech, cost = await validate_research(player.id, "plasma_cannon", db_session)
         assert tech.tech_id == "plasma_cannon"
         # With 1 owned in quantum category, cost = 6 - 1 = 5
         assert cost == 5
 
-    async def test_duplicate_tech_rejected(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "vr05")
-        await grant_technology(player.id, "ion_cannon", 1, db_session)
+    async def test_duplicate_tech_rejected(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id)
+        await _grant_techs(db_session, player.id, "ion_cannon")
         with pytest.raises(ValueError, match="already owns"):
             await validate_research(player.id, "ion_cannon", db_session)
 
-    async def test_unknown_tech_id_rejected(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "vr06")
+    async def test_unknown_tech_id_rejected(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id)
         with pytest.raises(ValueError, match="Unknown technology"):
             await validate_research(player.id, "totally_fake_tech", db_session)
 
@@ -386,98 +398,55 @@ class TestResearchValidation:
 # ---------------------------------------------------------------------------
 
 class TestApplyResearch:
-    async def _make_player(self, db, email_suffix, science=20):
-        from app.models.player import Player, Species
-        from app.models.game import Game, GameStatus, GamePhase
-        from app.models.user import User
-        from app.models.player_resources import PlayerResources
-
-        user = User(
-            email=f"applytest_{email_suffix}@example.com",
-            username=f"applytest_{email_suffix}",
-            hashed_password="x",
-        )
-        db.add(user)
-        await db.flush()
-
-        game = Game(
-            name=f"apply-test-{email_suffix}",
-            status=GameStatus.active,
-            max_players=2,
-            current_round=1,
-            current_phase=GamePhase.activation,
-            host_user_id=user.id,
-        )
-        db.add(game)
-        await db.flush()
-
-        player = Player(
-            game_id=game.id,
-            user_id=user.id,
-            species=Species.human,
-            turn_order=0,
-        )
-        db.add(player)
-        await db.flush()
-
-        resources = PlayerResources(
-            player_id=player.id, money=10, science=science, materials=10
-        )
-        db.add(resources)
-        await db.flush()
-
-        return player, resources
-
-    async def test_apply_research_deducts_science(self, db_session: AsyncSession):
-        player, resources = await self._make_player(db_session, "ar01", science=10)
+    async def test_apply_research_deducts_science(self, db_session: AsyncSession, module_player_id):
+        player, resources = await _load_module_player(db_session, module_player_id, science=10)
         await apply_research(player.id, "ion_cannon", 1, db_session)
         # ion_cannon costs 2 science, 10 - 2 = 8
         assert resources.science == 8
 
-    async def test_apply_research_records_acquisition(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "ar02", science=10)
+    async def test_apply_research_records_acquisition(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id, science=10)
         record = await apply_research(player.id, "improved_hull", 1, db_session)
         assert record.player_id == player.id
         assert record.tech_id == "improved_hull"
         assert record.acquired_round == 1
 
-    async def test_apply_research_insufficient_science(self, db_session: AsyncSession):
-        player, _ = await self._make_player(db_session, "ar03", science=1)
+    async def test_apply_research_insufficient_science(self, db_session: AsyncSession, module_player_id):
+        player, _ = await _load_module_player(db_session, module_player_id, science=1)
         # ion_cannon costs 2, player only has 1
         with pytest.raises(ValueError, match="Insufficient science"):
             await apply_research(player.id, "ion_cannon", 1, db_session)
 
-    async def test_apply_research_discount_reduces_cost(self, db_session: AsyncSession):
-        player, resources = await self._make_player(db_session, "ar04", science=15)
+    async def test_apply_research_discount_reduces_cost(self, db_session: AsyncSession, module_player_id):
+        player, resources = await _load_module_player(db_session, module_player_id, science=15)
         # Grant ion_cannon first (quantum, base cost 2)
-        await grant_technology(player.id, "ion_cannon", 1, db_session)
+        await _grant_techs(db_session, player.id, "ion_cannon")
         science_before = resources.science
         # flux_missile has base_cost=3, discount 1 (1 owned in quantum) => effective cost=2
         await apply_research(player.id, "flux_missile", 1, db_session)
         assert resources.science == science_before - 2
 
-    async def test_apply_research_zero_cost_possible(self, db_session: AsyncSession):
-        player, resources = await self._make_player(db_session, "ar05", science=15)
+    async def test_apply_research_zero_cost_possible(self, db_session: AsyncSession, module_player_id):
+        player, resources = await _load_module_player(db_session, module_player_id, science=15)
         # ion_cannon (base 2), flux_missile (base 3), positron_computer (base 3)
         # After owning 2 quantum techs, positron_computer costs 3-2=1
-        await grant_technology(player.id, "ion_cannon", 1, db_session)
-        await grant_technology(player.id, "flux_missile", 1, db_session)
+        await _grant_techs(db_session, player.id, "ion_cannon", "flux_missile")
         science_before = resources.science
         await apply_research(player.id, "positron_computer", 1, db_session)
         # 3 - 2 = 1
         assert resources.science == science_before - 1
 
     async def test_apply_research_owned_added_to_player_tech_ids(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, module_player_id
     ):
-        player, _ = await self._make_player(db_session, "ar06", science=20)
+        player, _ = await _load_module_player(db_session, module_player_id, science=20)
         await apply_research(player.id, "nuclear_drive", 1, db_session)
         ids = await get_player_tech_ids(player.id, db_session)
         assert "nuclear_drive" in ids
 
-    async def test_prospector_grant_adds_money_immediately(self, db_session: AsyncSession):
+    async def test_prospector_grant_adds_money_immediately(self, db_session: AsyncSession, module_player_id):
         """Ancient tech Prospector grants money immediately when granted."""
-        player, resources = await self._make_player(db_session, "ar07")
+        player, resources = await _load_module_player(db_session, module_player_id)
         money_before = resources.money
         await grant_technology(player.id, "prospector", 1, db_session)
         # prospector gives 3 money immediately (once=True, flat=3)
@@ -489,14 +458,14 @@ class TestApplyResearch:
 # ---------------------------------------------------------------------------
 
 class TestResearchActionAPI:
-    async def test_research_action_success(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_research_action_success(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         # Human starts with 3 science; ion_cannon costs 2
         resp = await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "ion_cannon"}},
+            json=_research_action("ion_cannon"),
             headers=auth_headers(tokens[0]),
         )
         assert resp.status_code == 201
@@ -504,12 +473,8 @@ class TestResearchActionAPI:
         assert data["action_type"] == "research"
         assert data["payload"]["tech_id"] == "ion_cannon"
 
-    async def test_research_without_tech_id_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client,
-            num_players=2,
-            species_list=["human", "planta"],
-        )
+    async def test_research_without_tech_id_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.post(
@@ -520,63 +485,54 @@ class TestResearchActionAPI:
         assert resp.status_code == 400
         assert "tech_id" in resp.json()["detail"]
 
-    async def test_research_insufficient_science_rejected(self, db_client: AsyncClient):
+    async def test_research_insufficient_science_rejected(self, db_client: AsyncClient, started_game_planta_human):
         # Planta starts with 3 science, antimatter_cannon costs 9+ → insufficient
-        tokens, game = await setup_started_game(
-            db_client,
-            num_players=2,
-            species_list=["planta", "human"],
-        )
+        tokens, game = started_game_planta_human
         game_id = game["id"]
 
         resp = await db_client.post(
             f"/games/{game_id}/action",
-            json={
-                "action_type": "research",
-                "payload": {"tech_id": "antimatter_cannon"},
-            },
+            json=_research_action("antimatter_cannon"),
             headers=auth_headers(tokens[0]),
         )
         assert resp.status_code == 400
 
-    async def test_research_missing_prerequisite_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_research_missing_prerequisite_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         # plasma_cannon requires ion_cannon
         resp = await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "plasma_cannon"}},
+            json=_research_action("plasma_cannon"),
             headers=auth_headers(tokens[0]),
         )
         assert resp.status_code == 400
         assert "prerequisite" in resp.json()["detail"].lower()
 
-    async def test_research_ancient_tech_rejected(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_research_ancient_tech_rejected(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "monolith"}},
+            json=_research_action("monolith"),
             headers=auth_headers(tokens[0]),
         )
         assert resp.status_code == 400
         assert "cannot be researched" in resp.json()["detail"].lower()
 
     async def test_research_deducts_science_visible_in_resources(
-        self, db_client: AsyncClient
+        self, db_client: AsyncClient, started_game_2p
     ):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
         # human starts with 3 science; ion_cannon costs 2 → should have 1 left
         await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "ion_cannon"}},
+            json=_research_action("ion_cannon"),
             headers=auth_headers(tokens[0]),
         )
         res_resp = await db_client.get(
@@ -592,8 +548,8 @@ class TestResearchActionAPI:
 # ---------------------------------------------------------------------------
 
 class TestTechnologiesEndpoint:
-    async def test_empty_technologies_on_game_start(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_empty_technologies_on_game_start(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -604,16 +560,14 @@ class TestTechnologiesEndpoint:
         assert resp.status_code == 200
         assert resp.json() == []
 
-    async def test_technologies_listed_after_research(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+    async def test_technologies_listed_after_research(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
         await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "ion_cannon"}},
+            json=_research_action("ion_cannon"),
             headers=auth_headers(tokens[0]),
         )
 
@@ -629,8 +583,8 @@ class TestTechnologiesEndpoint:
         assert techs[0]["category"] == "quantum"
         assert techs[0]["acquired_round"] == 1
 
-    async def test_technologies_endpoint_requires_auth(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_technologies_endpoint_requires_auth(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -639,8 +593,8 @@ class TestTechnologiesEndpoint:
         )
         assert resp.status_code == 401
 
-    async def test_technologies_404_for_invalid_game(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_technologies_404_for_invalid_game(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
 
         resp = await db_client.get(
             "/games/99999/players/1/technologies",
@@ -648,8 +602,8 @@ class TestTechnologiesEndpoint:
         )
         assert resp.status_code == 404
 
-    async def test_technologies_404_for_invalid_player(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_technologies_404_for_invalid_player(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -698,17 +652,15 @@ class TestTechnologiesEndpoint:
 # ---------------------------------------------------------------------------
 
 class TestAvailableTechnologiesEndpoint:
-    async def test_available_techs_excludes_owned(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+    async def test_available_techs_excludes_owned(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
         # Research ion_cannon
         await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "ion_cannon"}},
+            json=_research_action("ion_cannon"),
             headers=auth_headers(tokens[0]),
         )
 
@@ -720,8 +672,8 @@ class TestAvailableTechnologiesEndpoint:
         available_ids = {t["tech_id"] for t in resp.json()}
         assert "ion_cannon" not in available_ids
 
-    async def test_available_techs_excludes_ancient(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_available_techs_excludes_ancient(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -730,11 +682,10 @@ class TestAvailableTechnologiesEndpoint:
             headers=auth_headers(tokens[0]),
         )
         assert resp.status_code == 200
-        for tech in resp.json():
-            assert tech["category"] != "ancient"
+        assert "ancient" not in {tech["category"] for tech in resp.json()}
 
-    async def test_available_techs_excludes_prereq_not_met(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_available_techs_excludes_prereq_not_met(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -747,10 +698,8 @@ class TestAvailableTechnologiesEndpoint:
         # plasma_cannon requires ion_cannon — should not be available at start
         assert "plasma_cannon" not in available_ids
 
-    async def test_available_techs_shows_effective_cost(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+    async def test_available_techs_shows_effective_cost(self, db_client: AsyncClient, started_game_2p):
+        tokens, game = started_game_2p
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -765,11 +714,9 @@ class TestAvailableTechnologiesEndpoint:
         assert ion["base_cost"] == 2
 
     async def test_available_techs_discount_applies_after_research(
-        self, db_client: AsyncClient
+        self, db_client: AsyncClient, started_game_hydran_planta
     ):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["hydran_progress", "planta"]
-        )
+        tokens, game = started_game_hydran_planta
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -777,7 +724,7 @@ class TestAvailableTechnologiesEndpoint:
         # Research ion_cannon (cost 2) → 4 science left
         await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "research", "payload": {"tech_id": "ion_cannon"}},
+            json=_research_action("ion_cannon"),
             headers=auth_headers(tokens[0]),
         )
 
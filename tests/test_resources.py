@@ -9,20 +9,28 @@ Covers:
 - GET /games/{id}/players/{id}/resources endpoint
 """
 
+from collections.abc import Sequence
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.game import Game, GameStatus
+from app.models.player import Player
 from app.models.player_resources import PlayerResources
+from app.models.user import User
 from app.services.resource_service import (
     apply_upkeep_for_game,
     get_player_resources,
+    get_player_resources_bulk,
     perform_upkeep_for_player,
     use_influence_disc,
     validate_and_deduct_build_cost,
     validate_and_deduct_research_cost,
 )
 
+from tests.helpers import auth_headers
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers (mirror test_turn_engine.py pattern)
@@ -39,30 +47,33 @@ async def register_and_login(
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
-
-
-SPECIES_CYCLE = [
+SPECIES_CYCLE = (
     "human",
     "planta",
     "mechanema",
     "orion_hegemony",
     "eridani_empire",
     "hydran_progress",
-]
+)
 
 
 async def setup_started_game(
-    client: AsyncClient, num_players: int = 2, species_list: list[str] | None = None
+    client: AsyncClient,
+    num_players: int = 2,
+    species_list: Sequence[str] | None = None,
+    tag: str = "res",
 ) -> tuple[list[str], dict]:
-    """Create, populate, and start a game. Returns (tokens, game_dict)."""
+    """Create, populate, and start a game. Returns (tokens, game_dict).
+
+    `tag` prefixes the players' emails and usernames so that several games can
+    be set up in one module.
+    """
     if species_list is None:
         species_list = SPECIES_CYCLE[:num_players]
 
     tokens = []
-    emails = [f"res_p{i}@example.com" for i in range(num_players)]
-    usernames = [f"res_player{i}" for i in range(num_players)]
+    emails = [f"{tag}_p{i}@example.com" for i in range(num_players)]
+    usernames = [f"{tag}_player{i}" for i in range(num_players)]
 
     for i in range(num_players):
         token = await register_and_login(client, emails[i], usernames[i])
@@ -103,6 +114,47 @@ async def setup_started_game(
     return tokens, start_resp.json()
 
 
+# Every species line-up the API tests in this module play.
+_STARTED_GAME_SPECIES = (
+    ("human", "planta"),
+    ("mechanema", "planta"),
+    ("hydran_progress", "planta"),
+    ("eridani_empire", "planta"),
+)
+
+
+@pytest.fixture(scope="module")
+async def started_games(
+    module_db_client: AsyncClient,
+) -> dict[tuple[str, ...], tuple[list[str], dict]]:
+    """Started games keyed by species line-up, each built once per module.
+
+    All of them are built up front so that none is created inside a test's
+    SAVEPOINT. What a test does to a game through db_client is rolled back
+    with that SAVEPOINT (see db_session).
+    """
+    return {
+        species: await setup_started_game(
+            module_db_client, len(species), species, tag=f"res{i}"
+        )
+        for i, species in enumerate(_STARTED_GAME_SPECIES)
+    }
+
+
+# Fields every GET /games/{id}/players/{id}/resources response must carry.
+EXPECTED_RESOURCE_FIELDS = frozenset({
+    "player_id",
+    "money",
+    "science",
+    "materials",
+    "population_cubes",
+    "tradespheres",
+    "influence_discs_total",
+    "influence_discs_used",
+    "influence_discs_remaining",
+})
+
+
 async def get_resources(client: AsyncClient, game_id: int, player_id: int, token: str) -> dict:
     resp = await client.get(
         f"/games/{game_id}/players/{player_id}/resources",
@@ -112,30 +164,62 @@ async def get_resources(client: AsyncClient, game_id: int, player_id: int, token
     return resp.json()
 
 
+async def _make_player_with_resources(
+    db: AsyncSession,
+    tag: str,
+    *,
+    money: int = 5,
+    science: int = 5,
+    materials: int = 5,
+    tradespheres: int = 0,
+    discs_used: int = 0,
+) -> Player:
+    """Insert a player with the given resources in their own active game."""
+    user = User(email=f"{tag}@example.com", username=tag, hashed_password="x")
+    game = Game(name=tag, max_players=2, status=GameStatus.active)
+    db.add_all([user, game])
+    await db.flush()
+
+    player = Player(game_id=game.id, user_id=user.id, turn_order=0)
+    db.add(player)
+    await db.flush()
+
+    db.add(
+        PlayerResources(
+            player_id=player.id,
+            money=money,
+            science=science,
+            materials=materials,
+            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
+            tradespheres=tradespheres,
+            influence_discs_total=11,
+            influence_discs_used=discs_used,
+        )
+    )
+    await db.flush()
+    return player
+
+
 # ---------------------------------------------------------------------------
 # Starting resource allocation
 # ---------------------------------------------------------------------------
 
 class TestStartingResources:
-    async def test_resources_created_on_game_start(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_resources_created_on_game_start(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         players = game["players"]
 
         for i, player in enumerate(players):
             data = await get_resources(db_client, game_id, player["id"], tokens[i])
-            assert "money" in data
-            assert "science" in data
-            assert "materials" in data
-            assert "influence_discs_total" in data
+            missing = EXPECTED_RESOURCE_FIELDS - data.keys()
+            assert not missing, missing
             assert data["influence_discs_total"] == 11
             assert data["influence_discs_used"] == 0
             assert data["influence_discs_remaining"] == 11
 
-    async def test_human_starting_resources(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+    async def test_human_starting_resources(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -144,11 +228,9 @@ class TestStartingResources:
         assert data["science"] == 3
         assert data["materials"] == 3
 
-    async def test_mechanema_starting_resources(self, db_client: AsyncClient):
+    async def test_mechanema_starting_resources(self, db_client: AsyncClient, started_games):
         """Mechanema starts with 6 materials."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["mechanema", "planta"]
-        )
+        tokens, game = started_games[("mechanema", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -157,11 +239,9 @@ class TestStartingResources:
         assert data["money"] == 2
         assert data["science"] == 2
 
-    async def test_hydran_starting_resources(self, db_client: AsyncClient):
+    async def test_hydran_starting_resources(self, db_client: AsyncClient, started_games):
         """Hydran Progress starts with 6 science."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["hydran_progress", "planta"]
-        )
+        tokens, game = started_games[("hydran_progress", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -169,19 +249,17 @@ class TestStartingResources:
         assert data["science"] == 6
         assert data["money"] == 2
 
-    async def test_eridani_starting_resources(self, db_client: AsyncClient):
+    async def test_eridani_starting_resources(self, db_client: AsyncClient, started_games):
         """Eridani Empire starts with 6 money."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["eridani_empire", "planta"]
-        )
+        tokens, game = started_games[("eridani_empire", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
         data = await get_resources(db_client, game_id, host_player["id"], tokens[0])
         assert data["money"] == 6
 
-    async def test_starting_population_cubes(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_starting_population_cubes(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -196,107 +274,77 @@ class TestStartingResources:
 # Influence disc tracking
 # ---------------------------------------------------------------------------
 
-class TestInfluenceDiscs:
-    async def test_non_pass_action_uses_influence_disc(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
-        game_id = game["id"]
-        host_player = next(p for p in game["players"] if p["turn_order"] == 0)
-
-        # Player 0 takes an UPGRADE action (no resource cost, just modifies blueprint)
-        resp = await db_client.post(
-            f"/games/{game_id}/action",
-            json={
-                "action_type": "upgrade",
-                "payload": {
-                    "ship_type": "interceptor",
-                    "slots": ["nuclear_source", "electron_cannon", "electron_drive", None],
-                },
-            },
-            headers=auth_headers(tokens[0]),
-        )
-        assert resp.status_code == 201
-
-        # One disc should now be in use
-        data = await get_resources(db_client, game_id, host_player["id"], tokens[0])
-        assert data["influence_discs_used"] == 1
-        assert data["influence_discs_remaining"] == 10
-
-    async def test_pass_action_does_not_use_influence_disc(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
-        game_id = game["id"]
-        host_player = next(p for p in game["players"] if p["turn_order"] == 0)
-
-        # Player 0 passes
-        resp = await db_client.post(
-            f"/games/{game_id}/action",
-            json={"action_type": "pass"},
-            headers=auth_headers(tokens[0]),
-        )
-        assert resp.status_code == 201
+# Action bodies for POST /games/{id}/action; shared, so never mutate them.
+_PASS = {"action_type": "pass"}
+_UPGRADE_INTERCEPTOR = {
+    "action_type": "upgrade",
+    "payload": {
+        "ship_type": "interceptor",
+        "slots": ["nuclear_source", "electron_cannon", "electron_drive", None],
+    },
+}
+_UPGRADE_CRUISER = {
+    "action_type": "upgrade",
+    "payload": {
+        "ship_type": "cruiser",
+        "slots": ["nuclear_source", "electron_cannon", "electron_cannon", "electron_drive", None, None],
+    },
+}
 
-        # No disc should be used
-        data = await get_resources(db_client, game_id, host_player["id"], tokens[0])
-        assert data["influence_discs_used"] == 0
-        assert data["influence_discs_remaining"] == 11
 
-    async def test_multiple_actions_stack_influence_discs(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+class TestInfluenceDiscs:
+    @pytest.mark.parametrize(
+        ("actions", "expected_used"),
+        [
+            # An UPGRADE has no resource cost; it only spends the disc.
+            pytest.param([(0, _UPGRADE_INTERCEPTOR)], 1, id="non_pass_action_uses_disc"),
+            pytest.param([(0, _PASS)], 0, id="pass_does_not_use_disc"),
+            # The host acts twice and the guest once in between.
+            pytest.param(
+                [(0, _UPGRADE_INTERCEPTOR), (1, _UPGRADE_INTERCEPTOR), (0, _UPGRADE_CRUISER)],
+                2,
+                id="actions_stack_discs",
+            ),
+        ],
+    )
+    async def test_actions_use_influence_discs(
+        self, db_client: AsyncClient, started_games, actions, expected_used
+    ):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
-        # Player 0 acts, player 1 acts, player 0 acts again (3 total, but p0 acts twice)
-        await db_client.post(
-            f"/games/{game_id}/action",
-            json={
-                "action_type": "upgrade",
-                "payload": {"ship_type": "interceptor", "slots": ["nuclear_source", "electron_cannon", "electron_drive", None]},
-            },
-            headers=auth_headers(tokens[0]),
-        )
-        await db_client.post(
-            f"/games/{game_id}/action",
-            json={
-                "action_type": "upgrade",
-                "payload": {"ship_type": "interceptor", "slots": ["nuclear_source", "electron_cannon", "electron_drive", None]},
-            },
-            headers=auth_headers(tokens[1]),
-        )
-        await db_client.post(
-            f"/games/{game_id}/action",
-            json={
-                "action_type": "upgrade",
-                "payload": {"ship_type": "cruiser", "slots": ["nuclear_source", "electron_cannon", "electron_cannon", "electron_drive", None, None]},
-            },
-            headers=auth_headers(tokens[0]),
-        )
+        for seat, body in actions:
+            resp = await db_client.post(
+                f"/games/{game_id}/action", json=body, headers=auth_headers(tokens[seat])
+            )
+            assert resp.status_code == 201, resp.text
 
         data = await get_resources(db_client, game_id, host_player["id"], tokens[0])
-        assert data["influence_discs_used"] == 2
+        assert data["influence_discs_used"] == expected_used
+        assert data["influence_discs_remaining"] == 11 - expected_used
 
-    async def test_upkeep_resets_influence_discs(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_upkeep_resets_influence_discs(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
         # Player 0 uses a disc, then both players pass to enter combat
         await db_client.post(
             f"/games/{game_id}/action",
-            json={
-                "action_type": "upgrade",
-                "payload": {"ship_type": "interceptor", "slots": ["nuclear_source", "electron_cannon", "electron_drive", None]},
-            },
+            json=_UPGRADE_INTERCEPTOR,
             headers=auth_headers(tokens[0]),
         )
         # Player 1's turn; player 1 passes
         await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "pass"},
+            json=_PASS,
             headers=auth_headers(tokens[1]),
         )
         # Player 0 passes (now both have had their actions; p0 already acted once but hasn't passed)
         await db_client.post(
             f"/games/{game_id}/action",
-            json={"action_type": "pass"},
+            json=_PASS,
             headers=auth_headers(tokens[0]),
         )
 
@@ -316,36 +364,7 @@ class TestInfluenceDiscs:
 
     async def test_no_discs_remaining_blocks_action(self, db_session: AsyncSession):
         """Service-level test: use_influence_disc raises ValueError when all discs used."""
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        # Create minimal DB records
-        user = User(email="disc_test@example.com", username="disc_test", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(name="Disc Test", max_players=2, host_user_id=user.id, status=GameStatus.active)
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        # Create resources with all discs used
-        resources = PlayerResources(
-            player_id=player.id,
-            money=5,
-            science=5,
-            materials=5,
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
-            tradespheres=0,
-            influence_discs_total=11,
-            influence_discs_used=11,  # all used
-        )
-        db_session.add(resources)
-        await db_session.flush()
+        player = await _make_player_with_resources(db_session, "disc_test", discs_used=11)
 
         with pytest.raises(ValueError, match="No influence discs remaining"):
             await use_influence_disc(player.id, db_session)
@@ -356,11 +375,9 @@ class TestInfluenceDiscs:
 # ---------------------------------------------------------------------------
 
 class TestBuildCost:
-    async def test_build_interceptor_deducts_materials(self, db_client: AsyncClient):
+    async def test_build_interceptor_deducts_materials(self, db_client: AsyncClient, started_games):
         """BUILD with ship_type='interceptor' deducts 3 materials."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["mechanema", "planta"]
-        )
+        tokens, game = started_games[("mechanema", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -378,10 +395,8 @@ class TestBuildCost:
         after = await get_resources(db_client, game_id, host_player["id"], tokens[0])
         assert after["materials"] == before["materials"] - 3
 
-    async def test_build_cruiser_costs_5_materials(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["mechanema", "planta"]
-        )
+    async def test_build_cruiser_costs_5_materials(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("mechanema", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -397,50 +412,15 @@ class TestBuildCost:
 
     async def test_build_fails_with_insufficient_materials(self, db_session: AsyncSession):
         """validate_and_deduct_build_cost raises ValueError when materials < cost."""
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        user = User(
-            email="build_fail@example.com", username="build_fail", hashed_password="x"
-        )
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(
-            name="Build Test",
-            max_players=2,
-            host_user_id=user.id,
-            status=GameStatus.active,
-        )
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        resources = PlayerResources(
-            player_id=player.id,
-            money=5,
-            science=5,
-            materials=2,  # not enough for interceptor (costs 3)
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
-            tradespheres=0,
-            influence_discs_total=11,
-            influence_discs_used=0,
-        )
-        db_session.add(resources)
-        await db_session.flush()
+        # Not enough materials for an interceptor (costs 3)
+        player = await _make_player_with_resources(db_session, "build_fail", materials=2)
 
         with pytest.raises(ValueError, match="Insufficient materials"):
             await validate_and_deduct_build_cost(player.id, "interceptor", db_session)
 
-    async def test_build_via_api_fails_with_no_materials(self, db_client: AsyncClient):
+    async def test_build_via_api_fails_with_no_materials(self, db_client: AsyncClient, started_games):
         """Human player (3 materials) cannot afford a dreadnought (8 materials)."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
 
         resp = await db_client.post(
@@ -452,34 +432,7 @@ class TestBuildCost:
         assert "insufficient" in resp.json()["detail"].lower()
 
     async def test_build_unknown_ship_type_rejected(self, db_session: AsyncSession):
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        user = User(email="unk_ship@example.com", username="unk_ship", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(name="Unk", max_players=2, host_user_id=user.id, status=GameStatus.active)
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        resources = PlayerResources(
-            player_id=player.id,
-            money=5,
-            science=5,
-            materials=10,
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
-            tradespheres=0,
-            influence_discs_total=11,
-            influence_discs_used=0,
-        )
-        db_session.add(resources)
-        await db_session.flush()
+        player = await _make_player_with_resources(db_session, "unk_ship", materials=10)
 
         with pytest.raises(ValueError, match="Unknown ship type"):
             await validate_and_deduct_build_cost(player.id, "battleship", db_session)
@@ -491,34 +444,7 @@ class TestBuildCost:
 
 class TestResearchCost:
     async def test_research_deducts_science(self, db_session: AsyncSession):
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        user = User(email="res_sci@example.com", username="res_sci", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(name="Research Test", max_players=2, host_user_id=user.id, status=GameStatus.active)
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        resources = PlayerResources(
-            player_id=player.id,
-            money=5,
-            science=6,
-            materials=5,
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
-            tradespheres=0,
-            influence_discs_total=11,
-            influence_discs_used=0,
-        )
-        db_session.add(resources)
-        await db_session.flush()
+        player = await _make_player_with_resources(db_session, "res_sci", science=6)
 
         await validate_and_deduct_research_cost(player.id, 4, db_session)
 
@@ -526,43 +452,14 @@ class TestResearchCost:
         assert updated.science == 2
 
     async def test_research_fails_with_insufficient_science(self, db_session: AsyncSession):
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        user = User(email="res_fail@example.com", username="res_fail", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(name="Research Fail", max_players=2, host_user_id=user.id, status=GameStatus.active)
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        resources = PlayerResources(
-            player_id=player.id,
-            money=5,
-            science=2,
-            materials=5,
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
-            tradespheres=0,
-            influence_discs_total=11,
-            influence_discs_used=0,
-        )
-        db_session.add(resources)
-        await db_session.flush()
+        player = await _make_player_with_resources(db_session, "res_fail", science=2)
 
         with pytest.raises(ValueError, match="Insufficient science"):
             await validate_and_deduct_research_cost(player.id, 5, db_session)
 
-    async def test_research_with_science_cost_in_payload(self, db_client: AsyncClient):
+    async def test_research_with_science_cost_in_payload(self, db_client: AsyncClient, started_games):
         """If payload includes science_cost, science is deducted."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["hydran_progress", "planta"]
-        )
+        tokens, game = started_games[("hydran_progress", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -579,11 +476,9 @@ class TestResearchCost:
         after = await get_resources(db_client, game_id, host_player["id"], tokens[0])
         assert after["science"] == 3  # 6 - 3
 
-    async def test_research_with_only_tech_id_deducts_correct_science(self, db_client: AsyncClient):
+    async def test_research_with_only_tech_id_deducts_correct_science(self, db_client: AsyncClient, started_games):
         """Research action with only tech_id deducts the tech's actual science cost."""
-        tokens, game = await setup_started_game(
-            db_client, num_players=2, species_list=["human", "planta"]
-        )
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -608,34 +503,15 @@ class TestResearchCost:
 
 class TestUpkeepCalculation:
     async def test_upkeep_adds_tradesphere_income(self, db_session: AsyncSession):
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        user = User(email="trade_up@example.com", username="trade_up", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(name="Trade Upkeep", max_players=2, host_user_id=user.id, status=GameStatus.active)
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        resources = PlayerResources(
-            player_id=player.id,
+        player = await _make_player_with_resources(
+            db_session,
+            "trade_up",
             money=3,
             science=3,
             materials=3,
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
             tradespheres=2,  # 2 tradespheres = 2 money income
-            influence_discs_total=11,
-            influence_discs_used=3,
+            discs_used=3,
         )
-        db_session.add(resources)
-        await db_session.flush()
 
         result = await perform_upkeep_for_player(player.id, db_session)
 
@@ -647,34 +523,7 @@ class TestUpkeepCalculation:
         assert updated.influence_discs_used == 0  # action discs returned
 
     async def test_upkeep_with_no_income_does_nothing(self, db_session: AsyncSession):
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
-        user = User(email="zero_inc@example.com", username="zero_inc", hashed_password="x")
-        db_session.add(user)
-        await db_session.flush()
-
-        game = Game(name="Zero Income", max_players=2, host_user_id=user.id, status=GameStatus.active)
-        db_session.add(game)
-        await db_session.flush()
-
-        player = Player(game_id=game.id, user_id=user.id, turn_order=0)
-        db_session.add(player)
-        await db_session.flush()
-
-        resources = PlayerResources(
-            player_id=player.id,
-            money=5,
-            science=5,
-            materials=5,
-            population_cubes={"orbital": 5, "advanced": 5, "gauss": 5},
-            tradespheres=0,
-            influence_discs_total=11,
-            influence_discs_used=4,
-        )
-        db_session.add(resources)
-        await db_session.flush()
+        player = await _make_player_with_resources(db_session, "zero_inc", discs_used=4)
 
         result = await perform_upkeep_for_player(player.id, db_session)
 
@@ -685,17 +534,10 @@ class TestUpkeepCalculation:
         assert updated.influence_discs_used == 0
 
     async def test_apply_upkeep_for_game_processes_all_players(self, db_session: AsyncSession):
-        from app.models.player import Player
-        from app.models.game import Game, GameStatus
-        from app.models.user import User
-
         user1 = User(email="up1@example.com", username="up1", hashed_password="x")
         user2 = User(email="up2@example.com", username="up2", hashed_password="x")
-        db_session.add_all([user1, user2])
-        await db_session.flush()
-
-        game = Game(name="Multi Upkeep", max_players=2, host_user_id=user1.id, status=GameStatus.active)
-        db_session.add(game)
+        game = Game(name="Multi Upkeep", max_players=2, status=GameStatus.active)
+        db_session.add_all([user1, user2, game])
         await db_session.flush()
 
         p1 = Player(game_id=game.id, user_id=user1.id, turn_order=0)
@@ -722,13 +564,12 @@ class TestUpkeepCalculation:
 
         await apply_upkeep_for_game([p1.id, p2.id], db_session)
 
-        updated_r1 = await get_player_resources(p1.id, db_session)
-        updated_r2 = await get_player_resources(p2.id, db_session)
+        updated = await get_player_resources_bulk([p1.id, p2.id], db_session)
 
-        assert updated_r1.money == 4  # 3 + 1 tradesphere
-        assert updated_r1.influence_discs_used == 0
-        assert updated_r2.money == 9  # 6 + 3 tradespheres
-        assert updated_r2.influence_discs_used == 0
+        assert updated[p1.id].money == 4  # 3 + 1 tradesphere
+        assert updated[p1.id].influence_discs_used == 0
+        assert updated[p2.id].money == 9  # 6 + 3 tradespheres
+        assert updated[p2.id].influence_discs_used == 0
 
 
 # ---------------------------------------------------------------------------
@@ -736,8 +577,8 @@ class TestUpkeepCalculation:
 # ---------------------------------------------------------------------------
 
 class TestResourceEndpoint:
-    async def test_get_resources_returns_correct_fields(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_get_resources_returns_correct_fields(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -747,19 +588,12 @@ class TestResourceEndpoint:
         )
         assert resp.status_code == 200
         data = resp.json()
-        assert "player_id" in data
-        assert "money" in data
-        assert "science" in data
-        assert "materials" in data
-        assert "population_cubes" in data
-        assert "tradespheres" in data
-        assert "influence_discs_total" in data
-        assert "influence_discs_used" in data
-        assert "influence_discs_remaining" in data
+        missing = EXPECTED_RESOURCE_FIELDS - data.keys()
+        assert not missing, missing
         assert data["influence_discs_remaining"] == data["influence_discs_total"] - data["influence_discs_used"]
 
-    async def test_get_resources_requires_auth(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_get_resources_requires_auth(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
@@ -783,8 +617,8 @@ class TestResourceEndpoint:
         )
         assert resp.status_code == 400
 
-    async def test_get_resources_invalid_player_returns_404(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_get_resources_invalid_player_returns_404(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         game_id = game["id"]
 
         resp = await db_client.get(
@@ -793,8 +627,8 @@ class TestResourceEndpoint:
         )
         assert resp.status_code == 404
 
-    async def test_get_resources_invalid_game_returns_404(self, db_client: AsyncClient):
-        tokens, game = await setup_started_game(db_client, num_players=2)
+    async def test_get_resources_invalid_game_returns_404(self, db_client: AsyncClient, started_games):
+        tokens, game = started_games[("human", "planta")]
         host_player = next(p for p in game["players"] if p["turn_order"] == 0)
 
         resp = await db_client.get(
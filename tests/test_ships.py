@@ -14,6 +14,8 @@ Covers:
 - Species starting ships placed on homeworld at game start
 """
 
+from collections.abc import Sequence
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,12 +30,18 @@ from app.data.ship_parts import (
     list_ship_types,
     validate_blueprint_power,
 )
+from app.models.game import Game, GamePhase, GameStatus
+from app.models.player import Player, Species
+from app.models.player_resources import PlayerResources
+from app.models.user import User
 from app.services.ship_service import (
     apply_upgrade,
     get_blueprints_for_player,
     initialize_blueprints,
 )
 
+from tests.helpers import auth_headers
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -50,22 +58,18 @@ async def register_and_login(
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
-
-
-SPECIES_CYCLE = [
+SPECIES_CYCLE = (
     "human",
     "planta",
     "mechanema",
     "orion_hegemony",
     "eridani_empire",
     "hydran_progress",
-]
+)
 
 
 async def setup_started_game(
-    client: AsyncClient, num_players: int = 2, species_list: list[str] | None = None
+    client: AsyncClient, num_players: int = 2, species_list: Sequence[str] | None = None
 ) -> tuple[list[str], dict]:
     """Create, populate, and start a game. Returns (tokens, game_dict)."""
     if species_list is None:
@@ -299,27 +303,19 @@ class TestPowerBalance:
 
 class TestBlueprintInitialization:
     async def _make_player(self, db, species_str: str):
-        from app.models.player import Player, Species
-        from app.models.game import Game, GameStatus, GamePhase
-        from app.models.user import User
-
         user = User(
             email=f"bpinit_{species_str}@example.com",
             username=f"bpinit_{species_str}",
             hashed_password="x",
         )
-        db.add(user)
-        await db.flush()
-
         game = Game(
             name=f"bp-init-{species_str}",
             status=GameStatus.active,
             max_players=2,
             current_round=1,
             current_phase=GamePhase.activation,
-            host_user_id=user.id,
         )
-        db.add(game)
+        db.add_all([user, game])
         await db.flush()
 
         player = Player(
@@ -373,28 +369,19 @@ class TestBlueprintInitialization:
 
 class TestApplyUpgrade:
     async def _make_player_with_resources(self, db, species_str="human"):
-        from app.models.player import Player, Species
-        from app.models.game import Game, GameStatus, GamePhase
-        from app.models.user import User
-        from app.models.player_resources import PlayerResources
-
         user = User(
             email=f"upg_{species_str}_{id(db)}@example.com",
             username=f"upg_{species_str}_{id(db)}",
             hashed_password="x",
         )
-        db.add(user)
-        await db.flush()
-
         game = Game(
             name=f"upg-{species_str}",
             status=GameStatus.active,
             max_players=2,
             current_round=1,
             current_phase=GamePhase.activation,
-            host_user_id=user.id,
         )
-        db.add(game)
+        db.add_all([user, game])
         await db.flush()
 
         player = Player(
@@ -2,6 +2,8 @@
 
 from httpx import AsyncClient
 
+from tests.helpers import auth_headers
+
 
 # ---- helpers ----------------------------------------------------------------
 
@@ -11,8 +13,8 @@ async def register_and_login(client: AsyncClient, email: str, username: str, pas
     return resp.json()["access_token"]
 
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
+# One distinct species per seat, in seat order.
+_SPECIES = ("human", "planta", "mechanema", "orion_hegemony", "eridani_empire", "hydran_progress")
 
 
 async def setup_started_game(client: AsyncClient, num_players: int = 2) -> tuple[list[str], dict]:
@@ -21,7 +23,6 @@ async def setup_started_game(client: AsyncClient, num_players: int = 2) -> tuple
     tokens = []
     emails = [f"p{i}@example.com" for i in range(num_players)]
     usernames = [f"player{i}" for i in range(num_players)]
-    species = ["human", "planta", "mechanema", "orion_hegemony", "eridani_empire", "hydran_progress"]
 
     # Register all players
     for i in range(num_players):
@@ -59,7 +60,7 @@ async def setup_started_game(client: AsyncClient, num_players: int = 2) -> tuple
     for i in range(num_players):
         resp = await client.post(
             f"/games/{game_id}/select-species",
-            json={"species": species[i]},
+            json={"species": _SPECIES[i]},
             headers=auth_headers(tokens[i]),
         )
         assert resp.status_code == 200